@@ -14,3 +14,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+# 첫 요청 전에 템플릿 컴파일과 URL 리졸버 구성을 미리 수행합니다. (DJANGO_WARMUP=0 으로 끄기)
+from core.warmup import warm_up, warmup_enabled  # noqa: E402
+
+if warmup_enabled():
+    warm_up()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -39,12 +40,15 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.db_router.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # 스태프가 X-Profile: 1 헤더나 ?_profile=1 로 요청할 때만 동작 (core/profiler.py)
+    'core.profiler.ProfilerMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -64,6 +68,19 @@ TEMPLATES = [
     },
 ]
 
+# 핫 템플릿(core/jinja2/ 의 task_list, task_detail)용 Jinja2 엔진 (선택)
+# DJANGO_JINJA2_TEMPLATES=1 이면 Django 엔진보다 먼저 검색되고, 나머지 템플릿은 Django 엔진이 처리합니다.
+if os.environ.get('DJANGO_JINJA2_TEMPLATES') == '1':
+    TEMPLATES.insert(0, {
+        'BACKEND': 'django.template.backends.jinja2.Jinja2',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'environment': 'core.jinja2env.environment',
+            'context_processors': TEMPLATES[0]['OPTIONS']['context_processors'],
+        },
+    })
+
 WSGI_APPLICATION = 'config.wsgi.application'
 
 
@@ -77,6 +94,44 @@ DATABASES = {
     }
 }
 
+# 읽기 전용 복제본 (선택)
+# DJANGO_REPLICA_DB 에 파일 경로를 지정하면 로컬 SQLite 스냅샷을 복제본으로 사용합니다.
+# 스냅샷 갱신: python manage.py sync_replica
+REPLICA_DB_ALIAS = 'replica'
+if os.environ.get('DJANGO_REPLICA_DB'):
+    DATABASES[REPLICA_DB_ALIAS] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ['DJANGO_REPLICA_DB'],
+        # 테스트에서는 기본 테스트 DB를 그대로 바라봅니다.
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['core.db_router.PrimaryReplicaRouter']
+
+# 쓰기 요청 후 같은 사용자의 읽기를 기본 DB에 고정할 시간 (초)
+REPLICA_PIN_SECONDS = 5
+
+# 공개 심부름 피드 스냅샷 (로그인하지 않은 방문자용 미리 렌더링된 HTML/JSON)
+# 갱신: 심부름/리뷰 변경 후 자동(지연 발행) 또는 python manage.py publish_feed
+FEED_SNAPSHOTS_ENABLED = os.environ.get('DJANGO_FEED_SNAPSHOTS') == '1'
+FEED_SNAPSHOT_ROOT = BASE_DIR / 'feed_snapshots'
+FEED_SNAPSHOT_PAGES = 3
+FEED_SNAPSHOT_DEBOUNCE_SECONDS = 5
+
+# 스태프 전용 요청 프로파일 보고서 저장 위치와 보존 개수 (관리자 페이지 /admin/profiles/)
+PROFILER_ROOT = BASE_DIR / 'profiles'
+PROFILER_MAX_REPORTS = 100
+
+# 비싼 엔드포인트 요청 제한 (URL 별 설정은 core/urls.py 의 RATE_LIMITS)
+# 여러 워커가 버킷을 공유하려면 CACHES 에 공유 캐시를 추가하고 RATELIMIT_CACHE 로 지정합니다.
+RATELIMIT_ENABLED = os.environ.get('DJANGO_RATELIMIT', '1') != '0'
+RATELIMIT_CACHE = 'default'
+# 동시에 처리할 비싼 요청 수 (넘으면 503). 카운터도 RATELIMIT_CACHE 에 있으므로 locmem 이면 워커당, 공유 캐시면 전체 기준입니다.
+RATELIMIT_MAX_CONCURRENT = 8
+# 앞단 리버스 프록시 수. 0 이면 REMOTE_ADDR 를, N 이면 X-Forwarded-For 의 오른쪽에서 N 번째 주소를 클라이언트 IP 로 봅니다.
+# 프록시 없이 직접 노출될 때 0 이 아니면 클라이언트가 헤더를 위조해 버킷을 바꿀 수 있습니다.
+RATELIMIT_TRUSTED_PROXY_COUNT = int(os.environ.get('DJANGO_TRUSTED_PROXY_COUNT', '0'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -122,6 +177,27 @@ LOGIN_REDIRECT_URL = '/profile/'
 # 로그아웃 성공 후 리다이렉트될 URL (메인 페이지로 설정)
 LOGOUT_REDIRECT_URL = '/'
 
-DEBUG = True
-
-STATIC_ROOT = BASE_DIR / 'staticfiles'
\ No newline at end of file
+# 운영용 정적 파일 프로필 (core/static_assets.py)
+# DJANGO_STATIC_PROFILE=production 이면 collectstatic 이 해시 이름 + .gz/.br 변형을 만들고,
+# StaticFilesMiddleware 가 immutable 캐시 헤더와 함께 미리 압축된 파일을 서빙합니다.
+# (collectstatic 을 먼저 실행해야 합니다. brotli 패키지가 있으면 .br 도 생성)
+STATIC_PROFILE_PRODUCTION = os.environ.get('DJANGO_STATIC_PROFILE') == 'production'
+
+# 개발 환경에서는 켜져 있고, 운영 정적 프로필에서는 기본으로 꺼집니다. (DJANGO_DEBUG=1/0 으로 지정 가능)
+DEBUG = os.environ.get('DJANGO_DEBUG', '0' if STATIC_PROFILE_PRODUCTION else '1') == '1'
+if os.environ.get('DJANGO_ALLOWED_HOSTS'):
+    ALLOWED_HOSTS = os.environ['DJANGO_ALLOWED_HOSTS'].split(',')
+
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+if STATIC_PROFILE_PRODUCTION:
+    # DEBUG 에서는 매니페스트 저장소가 해시 없는 URL 을 돌려주므로 immutable 캐시가 적용되지 않습니다.
+    if DEBUG:
+        from django.core.exceptions import ImproperlyConfigured
+        raise ImproperlyConfigured('DJANGO_STATIC_PROFILE=production 은 DEBUG 가 꺼진 상태에서만 사용할 수 있습니다.')
+    STORAGES = {
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'core.static_assets.CompressedManifestStaticFilesStorage'},
+    }
+    MIDDLEWARE.insert(MIDDLEWARE.index('django.middleware.security.SecurityMiddleware') + 1,
+                      'core.static_assets.StaticFilesMiddleware')
@@ -18,7 +18,13 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from core import profiler
+
 urlpatterns = [
+    # 스태프 요청 프로파일 보고서 (admin/ 보다 먼저 와야 합니다)
+    path('admin/profiles/', admin.site.admin_view(profiler.report_list_view), name='profiler_reports'),
+    path('admin/profiles/<str:report_id>/', admin.site.admin_view(profiler.report_detail_view), name='profiler_report'),
+
     # 관리자 페이지 URL
     path('admin/', admin.site.urls),
     
@@ -3,28 +3,286 @@ from django.contrib import admin
 # Register your models here.
 # core/admin.py
 
-from django.contrib import admin
-from .models import UserProfile, Task, TaskApplication
+from datetime import timedelta
+
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.auth import get_user_model
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.template.response import TemplateResponse
+from django.urls import path
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from . import snapshots
+from .models import (
+    UserProfile, Task, TaskApplication, TaskReview, LeaderboardEntry, StatsRollup, RollupWatermark,
+    ArchivedTask, ArchivedTaskApplication,
+)
+
+User = get_user_model()
+
+
+# -------------------- 대용량 테이블용 공통 설정 --------------------
+
+class EstimatedCountPaginator(Paginator):
+    """
+    필터가 없는 목록은 정확한 COUNT(*) 대신 DB 통계의 추정 행 수를 사용하고,
+    필터가 있는 목록은 MAX_EXACT_COUNT 까지만 세는 페이지네이터입니다.
+    """
+    MAX_EXACT_COUNT = 10000
+
+    @cached_property
+    def count(self):
+        query = self.object_list.query
+        if not query.has_filters():
+            estimate = estimated_row_count(self.object_list.model)
+            # 작은 테이블은 통계가 오래되었을 수 있으므로 그대로 셉니다.
+            if estimate is not None and estimate >= self.MAX_EXACT_COUNT:
+                return estimate
+        # 상한까지만 세어 대형 테이블 전체 스캔을 피합니다.
+        return self.object_list.order_by()[:self.MAX_EXACT_COUNT].count()
+
+
+def estimated_row_count(model):
+    """ DB 통계에 기록된 추정 행 수를 반환합니다. 통계가 없으면 None. """
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            # ANALYZE 가 실행된 적이 없으면 sqlite_stat1 테이블 자체가 없습니다.
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                return None
+            cursor.execute('SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1', [table])
+        elif connection.vendor == 'postgresql':
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE relname = %s', [table])
+        else:
+            return None
+        row = cursor.fetchone()
+
+    if row is None or row[0] is None:
+        return None
+    estimate = int(str(row[0]).split()[0])
+    return estimate if estimate >= 0 else None
+
+
+class ScalableAdmin(admin.ModelAdmin):
+    """ 수백만 행 테이블을 위한 목록 설정: 추정 개수, 전체 개수 쿼리 생략 """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+
+class CompletedCountFilter(admin.SimpleListFilter):
+    """ 완료 수의 모든 고유값을 읽지 않도록 칭호 기준 구간으로 필터링합니다. """
+    title = '완료한 심부름 수'
+    parameter_name = 'completed'
+
+    RANGES = {
+        '0': (0, 0),
+        '1-4': (1, 4),
+        '5-9': (5, 9),
+        '10+': (10, None),
+    }
+
+    def lookups(self, request, model_admin):
+        return [
+            ('0', '🐣 새내기 (0건)'),
+            ('1-4', '🌱 심부름 초보 (1~4건)'),
+            ('5-9', '🏅 숙련된 도우미 (5~9건)'),
+            ('10+', '👑 심부름 마스터 (10건 이상)'),
+        ]
+
+    def queryset(self, request, queryset):
+        if self.value() not in self.RANGES:
+            return queryset
+        low, high = self.RANGES[self.value()]
+        queryset = queryset.filter(tasks_completed__gte=low)
+        if high is not None:
+            queryset = queryset.filter(tasks_completed__lte=high)
+        return queryset
+
 
 # 1. UserProfile 모델 등록
 @admin.register(UserProfile)
-class UserProfileAdmin(admin.ModelAdmin):
-    list_display = ('user', 'points', 'tasks_completed')
+class UserProfileAdmin(ScalableAdmin):
+    list_display = ('user', 'points', 'tasks_completed', 'review_count', 'average_rating')
+    list_select_related = ('user',)
     search_fields = ('user__username', 'bio')
-    list_filter = ('tasks_completed',)
-    
+    list_filter = (CompletedCountFilter,)
+    autocomplete_fields = ('user',)
+    actions = ['recompute_stats']
+
+    @admin.action(description='선택한 프로필의 완료 수 / 리뷰 요약 다시 계산')
+    def recompute_stats(self, request, queryset):
+        def completed_count(model):
+            completed = (
+                model.objects.filter(assigned_to=OuterRef('user'), status='completed')
+                .order_by().values('assigned_to').annotate(count=Count('id')).values('count')
+            )
+            return Coalesce(Subquery(completed), 0)
+
+        def review_aggregate(aggregate, **filters):
+            reviews = (
+                TaskReview.objects.filter(reviewed_user=OuterRef('user'), **filters)
+                .order_by().values('reviewed_user').annotate(value=aggregate).values('value')
+            )
+            return Coalesce(Subquery(reviews), 0)
+
+        updated = queryset.update(
+            # 보관 테이블로 옮겨진 완료 심부름도 함께 셉니다.
+            tasks_completed=completed_count(Task) + completed_count(ArchivedTask),
+            review_count=review_aggregate(Count('id')),
+            rating_sum=review_aggregate(Sum('rating')),
+            **{f'rating_{star}_count': review_aggregate(Count('id'), rating=star) for star in range(1, 6)},
+        )
+        self.message_user(request, f'{updated}개 프로필의 통계를 다시 계산했습니다.', messages.SUCCESS)
+
+
+class TaskActionForm(ActionForm):
+    """ 재할당 액션에서 사용할 도우미 이름 입력칸 (비우면 할당 해제) """
+    assignee = forms.CharField(required=False, label='새 도우미 (사용자 이름)')
+
+
 # 2. Task 모델 등록
 @admin.register(Task)
-class TaskAdmin(admin.ModelAdmin):
+class TaskAdmin(ScalableAdmin):
     list_display = ('title', 'registrant', 'reward_points', 'status', 'due_date', 'assigned_to')
+    list_select_related = ('registrant', 'assigned_to')
     list_filter = ('status', 'created_at', 'due_date')
     search_fields = ('title', 'content', 'registrant__username')
-    raw_id_fields = ('registrant', 'assigned_to') # 사용자 검색을 쉽게
+    autocomplete_fields = ('registrant', 'assigned_to') # 사용자 검색을 쉽게
+    action_form = TaskActionForm
+    actions = ['expire_tasks', 'reassign_tasks']
+
+    @admin.action(description='선택한 심부름 마감 처리')
+    def expire_tasks(self, request, queryset):
+        updated = queryset.filter(status__in=['open', 'assigned']).update(status='expired', closed_at=timezone.now())
+        snapshots.schedule_publish()  # update() 는 시그널을 보내지 않으므로 직접 예약
+        self.message_user(request, f'{updated}개 심부름을 마감 처리했습니다.', messages.SUCCESS)
+
+    @admin.action(description='선택한 심부름 도우미 재할당 (비우면 모집 재개)')
+    def reassign_tasks(self, request, queryset):
+        username = request.POST.get('assignee', '').strip()
+        queryset = queryset.filter(status__in=['open', 'assigned'])
+
+        if not username:
+            updated = queryset.update(status='open', assigned_to=None)
+            snapshots.schedule_publish()
+            self.message_user(request, f'{updated}개 심부름의 도우미 할당을 해제했습니다.', messages.SUCCESS)
+            return
+
+        assignee = User.objects.filter(username=username).first()
+        if assignee is None:
+            self.message_user(request, f'"{username}" 사용자를 찾을 수 없습니다.', messages.ERROR)
+            return
+        updated = queryset.exclude(registrant=assignee).update(status='assigned', assigned_to=assignee)
+        snapshots.schedule_publish()
+        self.message_user(request, f'{updated}개 심부름을 {username}님에게 할당했습니다.', messages.SUCCESS)
+
 
 # 3. TaskApplication 모델 등록
 @admin.register(TaskApplication)
-class TaskApplicationAdmin(admin.ModelAdmin):
+class TaskApplicationAdmin(ScalableAdmin):
     list_display = ('task', 'applicant', 'status', 'applied_at')
+    # Task.__str__ 가 등록자 이름을 사용하므로 task__registrant 까지 함께 가져옵니다.
+    list_select_related = ('task__registrant', 'applicant')
     list_filter = ('status', 'applied_at')
     search_fields = ('task__title', 'applicant__username')
-    raw_id_fields = ('task', 'applicant')
\ No newline at end of file
+    autocomplete_fields = ('task', 'applicant')
+
+
+# 4. LeaderboardEntry 모델 등록 (증분 갱신되는 리더보드 확인용)
+@admin.register(LeaderboardEntry)
+class LeaderboardEntryAdmin(ScalableAdmin):
+    list_display = ('user', 'period', 'bucket', 'score', 'tasks_completed', 'rating_count')
+    list_select_related = ('user',)
+    list_filter = ('period',)
+    search_fields = ('user__username', 'bucket')
+    autocomplete_fields = ('user',)
+
+
+# 5. StatsRollup 모델 등록 + 통계 대시보드 (롤업 테이블만 조회)
+@admin.register(StatsRollup)
+class StatsRollupAdmin(admin.ModelAdmin):
+    list_display = ('bucket_start', 'granularity', 'tasks_created', 'tasks_completed', 'tasks_expired', 'points_paid', 'average_rating')
+    list_filter = ('granularity',)
+    date_hierarchy = 'bucket_start'
+
+    # 롤업은 rollup_stats 명령만 갱신합니다.
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        urls = [
+            path('dashboard/', self.admin_site.admin_view(self.dashboard_view), name='core_statsrollup_dashboard'),
+        ]
+        return urls + super().get_urls()
+
+    def dashboard_view(self, request):
+        now = timezone.now()
+        daily = StatsRollup.objects.filter(granularity='day', bucket_start__gte=now - timedelta(days=30))
+        hourly = StatsRollup.objects.filter(granularity='hour', bucket_start__gte=now - timedelta(hours=48))
+        totals = daily.aggregate(
+            tasks_created=Sum('tasks_created'),
+            tasks_completed=Sum('tasks_completed'),
+            tasks_expired=Sum('tasks_expired'),
+            points_paid=Sum('points_paid'),
+            rating_sum=Sum('rating_sum'),
+            rating_count=Sum('rating_count'),
+        )
+        if totals['rating_count']:
+            totals['average_rating'] = round(totals['rating_sum'] / totals['rating_count'], 2)
+
+        context = {
+            **self.admin_site.each_context(request),
+            'title': '운영 통계 대시보드',
+            'opts': self.model._meta,
+            'daily': daily,
+            'hourly': hourly,
+            'totals': totals,
+            'watermarks': RollupWatermark.objects.all(),
+        }
+        return TemplateResponse(request, 'admin/core/statsrollup/dashboard.html', context)
+
+
+# 6. TaskReview 모델 등록
+@admin.register(TaskReview)
+class TaskReviewAdmin(ScalableAdmin):
+    list_display = ('__str__', 'reviewer', 'reviewed_user', 'rating', 'created_at')
+    # __str__ 가 심부름(또는 보관된 심부름) 제목과 리뷰 대상자 이름을 사용합니다.
+    list_select_related = ('task', 'archived_task', 'reviewer', 'reviewed_user')
+    list_filter = ('rating', 'created_at')
+    search_fields = ('reviewer__username', 'reviewed_user__username')
+    autocomplete_fields = ('task', 'archived_task', 'reviewer', 'reviewed_user')
+
+
+# 7. 보관된 심부름 (읽기 전용)
+class ArchivedTaskApplicationInline(admin.TabularInline):
+    model = ArchivedTaskApplication
+    fields = ('applicant', 'status', 'applied_at')
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+@admin.register(ArchivedTask)
+class ArchivedTaskAdmin(ScalableAdmin):
+    list_display = ('id', 'title', 'registrant', 'reward_points', 'status', 'closed_at', 'assigned_to')
+    list_select_related = ('registrant', 'assigned_to')
+    list_filter = ('status', 'closed_at')
+    search_fields = ('title', 'registrant__username')
+    inlines = [ArchivedTaskApplicationInline]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        # 시그널 리시버 등록 (views 임포트 여부와 무관하게 워커 시작 시 연결)
+        from . import signals  # noqa: F401
@@ -0,0 +1,82 @@
+# core/archive.py
+
+"""
+완료/마감 심부름 보관(아카이브)
+
+보존 기간이 지난 완료/마감 심부름과 그 지원 기록을 배치 단위 트랜잭션으로
+ArchivedTask / ArchivedTaskApplication 테이블로 옮겨 메인 Task 테이블을 작게 유지합니다.
+리뷰는 삭제되지 않고 archived_task 로 다시 연결되므로 별점/리뷰 기록은 그대로 남습니다.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.http import Http404
+from django.utils import timezone
+
+from .models import Task, TaskApplication, TaskReview, ArchivedTask, ArchivedTaskApplication
+
+# 완료/마감 후 메인 테이블에 남겨둘 기간 (일)
+ARCHIVE_RETENTION_DAYS = getattr(settings, 'TASK_ARCHIVE_RETENTION_DAYS', 90)
+
+ARCHIVE_BATCH_SIZE = 500
+
+TASK_FIELDS = (
+    'id', 'title', 'content', 'reward_points', 'location', 'status', 'required_gender', 'min_rating_required',
+    'created_at', 'due_date', 'closed_at', 'registrant_id', 'assigned_to_id',
+)
+APPLICATION_FIELDS = ('id', 'task_id', 'applicant_id', 'status', 'applied_at')
+
+
+def archivable_tasks(cutoff):
+    return Task.objects.filter(status__in=Task.CLOSED_STATUSES, closed_at__lt=cutoff)
+
+
+def archive_batch(cutoff, batch_size=ARCHIVE_BATCH_SIZE):
+    """ 보관 대상 심부름을 최대 batch_size 개 옮기고, 옮긴 개수를 반환합니다. """
+    with transaction.atomic():
+        ids = list(archivable_tasks(cutoff).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return 0
+
+        ArchivedTask.objects.bulk_create([
+            ArchivedTask(**row) for row in Task.objects.filter(pk__in=ids).values(*TASK_FIELDS)
+        ])
+        ArchivedTaskApplication.objects.bulk_create([
+            ArchivedTaskApplication(**row)
+            for row in TaskApplication.objects.filter(task_id__in=ids).values(*APPLICATION_FIELDS)
+        ])
+        # 리뷰는 보관된 심부름으로 옮겨 연결합니다. (Task 삭제 시 CASCADE 로 지워지지 않도록 먼저 처리)
+        TaskReview.objects.filter(task_id__in=ids).update(archived_task_id=F('task_id'), task=None)
+
+        TaskApplication.objects.filter(task_id__in=ids).delete()
+        Task.objects.filter(pk__in=ids).delete()
+    return len(ids)
+
+
+def archive_tasks(retention_days=ARCHIVE_RETENTION_DAYS, batch_size=ARCHIVE_BATCH_SIZE, max_batches=None, now=None):
+    """
+    보존 기간이 지난 심부름을 배치 단위로 모두 옮깁니다.
+    배치마다 트랜잭션이 끝나므로 쓰기 잠금은 한 배치 동안만 유지됩니다.
+    """
+    cutoff = (now or timezone.now()) - timedelta(days=retention_days)
+    total = batches = 0
+    while max_batches is None or batches < max_batches:
+        moved = archive_batch(cutoff, batch_size)
+        if not moved:
+            break
+        total += moved
+        batches += 1
+    return total
+
+
+def get_task_or_archived(pk):
+    """ 메인 테이블에 없으면 보관 테이블에서 심부름을 찾습니다. (상세 페이지용) """
+    task = Task.objects.select_related('registrant', 'assigned_to').filter(pk=pk).first()
+    if task is None:
+        task = ArchivedTask.objects.select_related('registrant', 'assigned_to').filter(pk=pk).first()
+    if task is None:
+        raise Http404('심부름을 찾을 수 없습니다.')
+    return task
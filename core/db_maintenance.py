@@ -0,0 +1,174 @@
+# core/db_maintenance.py
+
+"""
+SQLite 유지보수
+
+심부름/지원/세션 행이 삭제되어도 SQLite 파일은 줄어들지 않고, 플래너 통계(sqlite_stat1)도
+직접 ANALYZE 하지 않으면 갱신되지 않습니다. 이 모듈은 다음을 제공합니다.
+
+1. ANALYZE (analysis_limit 로 표본 크기 제한) + PRAGMA optimize
+2. 점진적 VACUUM: PRAGMA incremental_vacuum(N) 을 짧은 트랜잭션으로 나눠 실행해 쓰기 잠금을 오래 잡지 않음
+3. 상태 보고: 파일/페이지 크기, 빈 페이지(freelist) 비율, 테이블·인덱스별 크기, core 모델별 행 수
+4. 만료 세션 삭제: 기본키 묶음 단위로 나눠 지워 쓰기 잠금을 오래 잡지 않음
+
+점진적 VACUUM 은 auto_vacuum = INCREMENTAL 인 DB 에서만 동작합니다.
+기존 DB 를 전환하려면 한 번 전체 VACUUM 이 필요합니다. (enable_incremental_vacuum)
+"""
+
+import time
+
+from django.apps import apps
+from django.contrib.sessions.models import Session
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.utils import timezone
+
+AUTO_VACUUM_MODES = {0: 'none', 1: 'full', 2: 'incremental'}
+
+# ANALYZE 가 인덱스마다 살펴볼 대략적인 행 수 (0 이면 전체)
+ANALYSIS_LIMIT = 1000
+
+# 점진적 VACUUM 한 단계에서 반환할 페이지 수와 단계 사이 쉬는 시간(초)
+VACUUM_STEP_PAGES = 256
+VACUUM_STEP_PAUSE = 0.05
+
+# 만료 세션을 한 번에 지울 개수
+SESSION_DELETE_BATCH = 1000
+
+
+def _pragma(cursor, name):
+    cursor.execute(f'PRAGMA {name}')
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def analyze(using=DEFAULT_DB_ALIAS, analysis_limit=ANALYSIS_LIMIT):
+    """ 플래너 통계를 갱신합니다. 소요 시간(ms)을 반환합니다. """
+    started = time.perf_counter()
+    with connections[using].cursor() as cursor:
+        cursor.execute(f'PRAGMA analysis_limit = {int(analysis_limit)}')
+        cursor.execute('ANALYZE')
+        cursor.execute('PRAGMA optimize')
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def enable_incremental_vacuum(using=DEFAULT_DB_ALIAS):
+    """ auto_vacuum 을 INCREMENTAL 로 바꿉니다. 전체 VACUUM 이 실행되므로 DB 가 잠시 잠깁니다. """
+    with connections[using].cursor() as cursor:
+        if _pragma(cursor, 'auto_vacuum') == 2:
+            return False
+        cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        cursor.execute('VACUUM')
+    return True
+
+
+def incremental_vacuum(using=DEFAULT_DB_ALIAS, step_pages=VACUUM_STEP_PAGES, max_steps=None, pause=VACUUM_STEP_PAUSE):
+    """
+    빈 페이지를 step_pages 개씩 파일에서 반환합니다.
+    단계마다 커밋되므로 다른 쓰기 요청은 한 단계 이상 기다리지 않습니다. 반환한 페이지 수를 반환합니다.
+    한 단계에서 반환한 페이지가 없으면 (다른 연결이 읽는 중 등) max_steps 와 관계없이 멈춥니다.
+    """
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if _pragma(cursor, 'auto_vacuum') != 2:
+            return 0
+
+        released = 0
+        steps = 0
+        while max_steps is None or steps < max_steps:
+            before = _pragma(cursor, 'freelist_count')
+            if not before:
+                break
+            # autocommit 상태이므로 각 PRAGMA 가 별도 트랜잭션으로 커밋됩니다.
+            cursor.execute(f'PRAGMA incremental_vacuum({int(step_pages)})')
+            cursor.fetchall()
+            freed = before - _pragma(cursor, 'freelist_count')
+            if freed <= 0:
+                break
+            released += freed
+            steps += 1
+            if pause:
+                time.sleep(pause)
+    return released
+
+
+def delete_expired_sessions(using=DEFAULT_DB_ALIAS, batch_size=SESSION_DELETE_BATCH):
+    """ 만료된 세션을 batch_size 개씩 기본키로 골라 지웁니다. 지운 개수를 반환합니다. """
+    expired = Session.objects.using(using).filter(expire_date__lt=timezone.now())
+    deleted = 0
+    while True:
+        keys = list(expired.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not keys:
+            break
+        deleted += Session.objects.using(using).filter(pk__in=keys).delete()[0]
+        if len(keys) < batch_size:
+            break
+    return deleted
+
+
+def _object_sizes(cursor):
+    """ dbstat 가상 테이블로 테이블/인덱스별 크기를 구합니다. dbstat 이 없는 빌드에서는 None. """
+    try:
+        cursor.execute(
+            'SELECT name, COUNT(*), SUM(pgsize), SUM(unused) FROM dbstat GROUP BY name ORDER BY SUM(pgsize) DESC'
+        )
+    except DatabaseError:
+        return None
+    return {
+        name: {
+            'pages': pages,
+            'bytes': size,
+            # 페이지 안에서 쓰이지 않는 공간 비율 (삭제가 많으면 커짐)
+            'unused_ratio': round(unused / size, 4) if size else 0.0,
+        }
+        for name, pages, size, unused in cursor.fetchall()
+    }
+
+
+def database_report(using=DEFAULT_DB_ALIAS):
+    """ DB 상태를 JSON 으로 직렬화할 수 있는 dict 로 반환합니다. """
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        page_size = _pragma(cursor, 'page_size')
+        page_count = _pragma(cursor, 'page_count')
+        freelist_count = _pragma(cursor, 'freelist_count')
+
+        cursor.execute("SELECT type, name, tbl_name FROM sqlite_master WHERE type IN ('table', 'index') ORDER BY name")
+        objects = cursor.fetchall()
+        sizes = _object_sizes(cursor)
+
+        report = {
+            'database': str(connection.settings_dict['NAME']),
+            'database_bytes': page_size * page_count,  # WAL 파일 제외
+            'sqlite_version': connection.Database.sqlite_version,
+            'journal_mode': _pragma(cursor, 'journal_mode'),
+            'auto_vacuum': AUTO_VACUUM_MODES.get(_pragma(cursor, 'auto_vacuum')),
+            'page_size': page_size,
+            'page_count': page_count,
+            'freelist_count': freelist_count,
+            'freelist_ratio': round(freelist_count / page_count, 4) if page_count else 0.0,
+            'dbstat_available': sizes is not None,
+        }
+
+    report['tables'] = {}
+    report['indexes'] = {}
+    for object_type, name, table in objects:
+        entry = {'table': table} if object_type == 'index' else {}
+        if sizes is not None:
+            entry.update(sizes.get(name, {'pages': 0, 'bytes': 0, 'unused_ratio': 0.0}))
+        report['tables' if object_type == 'table' else 'indexes'][name] = entry
+
+    # 아직 마이그레이션되지 않은 모델은 None
+    report['row_counts'] = {
+        model._meta.label: (
+            model._base_manager.using(using).count() if model._meta.db_table in report['tables'] else None
+        )
+        for model in apps.get_app_config('core').get_models()
+    }
+    return report
+
+
+def integrity_check(using=DEFAULT_DB_ALIAS):
+    """ PRAGMA quick_check 결과 목록을 반환합니다. 정상이면 ['ok']. """
+    with connections[using].cursor() as cursor:
+        cursor.execute('PRAGMA quick_check')
+        return [row[0] for row in cursor.fetchall()]
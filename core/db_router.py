@@ -0,0 +1,148 @@
+# core/db_router.py
+
+"""
+읽기 복제본(replica) 라우팅
+
+- 쓰기는 항상 기본 DB(default)로 보냅니다.
+- 읽기는 "복제본 읽기 허용" 범위 안에서만 복제본으로 보냅니다.
+  ReplicaRoutingMiddleware 가 GET/HEAD 요청을 이 범위로 감싸고,
+  스크립트/관리 명령에서는 replica_reads() 로 직접 감쌀 수 있습니다.
+- POST 등 쓰기 요청, 또는 HTTP 메서드와 관계없이 실제로 DB 에 쓴 요청 뒤 REPLICA_PIN_SECONDS 동안은
+  같은 사용자의 요청을 기본 DB에 고정해 자신이 방금 쓴 데이터를 바로 읽을 수 있게 합니다. (read-your-writes)
+  "실제로 썼는지"는 요청 처리 중 라우터의 db_for_write 가 호출되었는지로 판단합니다.
+- 기본 DB 트랜잭션(@transaction.atomic) 안의 읽기는 항상 기본 DB에서 읽습니다.
+- 세션·사용자(auth)처럼 항상 최신이어야 하는 앱은 PRIMARY_ONLY_APPS 로 복제본에서 제외합니다.
+  (복제본은 sync_replica 를 실행할 때만 갱신되므로, 그 뒤 가입한 사용자는 복제본에 없습니다)
+- 기본 DB에서 읽은 객체의 관계(예: request.user.userprofile)도 기본 DB에서 읽습니다.
+
+settings.DATABASES 에 복제본 별칭이 없으면 모든 쿼리가 기본 DB로 갑니다.
+"""
+
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = getattr(settings, 'REPLICA_DB_ALIAS', 'replica')
+
+# 쓰기 요청 후 기본 DB에 고정할 시간 (초)
+REPLICA_PIN_SECONDS = getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+PRIMARY_ONLY_APPS = getattr(settings, 'REPLICA_PRIMARY_ONLY_APPS', ('sessions', 'auth'))
+
+PIN_COOKIE_NAME = 'primary_pin'
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_replica_allowed = ContextVar('replica_allowed', default=False)
+# 요청마다 ReplicaRoutingMiddleware 가 [False] 를 넣고, db_for_write 가 호출되면 True 로 바꿉니다.
+_request_writes = ContextVar('request_writes', default=None)
+
+
+def replica_configured():
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def read_alias():
+    """ 현재 범위에서 읽기 쿼리가 사용할 DB 별칭 (queryset.using() 에 직접 넘길 때 사용) """
+    if _replica_allowed.get() and replica_configured():
+        return REPLICA_DB_ALIAS
+    return DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def replica_reads(allowed=True):
+    """ 이 범위 안의 읽기 쿼리를 복제본으로 보냅니다. (allowed=False 면 기본 DB에 고정) """
+    token = _replica_allowed.set(allowed)
+    try:
+        yield
+    finally:
+        _replica_allowed.reset(token)
+
+
+def use_primary():
+    """ 이 범위 안의 읽기 쿼리를 기본 DB에 고정합니다. """
+    return replica_reads(allowed=False)
+
+
+class PrimaryReplicaRouter:
+    """ settings.DATABASE_ROUTERS 에 등록하는 라우터 """
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return DEFAULT_DB_ALIAS
+        # 기본 DB에서 읽은 객체에서 따라가는 관계는 같은 DB에서 읽습니다.
+        # (요청 사용자는 항상 기본 DB에서 읽으므로 자신의 프로필도 기본 DB에서 읽게 됩니다)
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db == DEFAULT_DB_ALIAS:
+            return DEFAULT_DB_ALIAS
+        # 쓰기 트랜잭션 안의 읽기(예: @transaction.atomic 뷰)는 같은 DB에서 읽어야 합니다.
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        writes = _request_writes.get()
+        if writes is not None:
+            writes[0] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB의 사본이므로 두 별칭의 객체를 서로 연결해도 됩니다.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본 스키마는 sync_replica 스냅샷으로만 갱신합니다.
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    """
+    읽기 전용 요청(GET/HEAD)은 복제본에서 읽고, 쓰기 요청과 그 직후 요청은 기본 DB에서 읽습니다.
+    GET 요청이라도 처리 중 DB 에 썼다면 직후 요청을 기본 DB에 고정합니다.
+    고정 시각은 쿠키에 저장하므로 세션을 읽지 않고도 판단할 수 있습니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        is_write = request.method not in SAFE_METHODS
+        writes = [False]
+        writes_token = _request_writes.set(writes)
+        try:
+            with replica_reads(allowed=not is_write and not self.is_pinned(request)):
+                response = self.get_response(request)
+        finally:
+            _request_writes.reset(writes_token)
+
+        if is_write or writes[0]:
+            pin_until = time.time() + REPLICA_PIN_SECONDS
+            response.set_cookie(PIN_COOKIE_NAME, f'{pin_until:.0f}', max_age=REPLICA_PIN_SECONDS, httponly=True, samesite='Lax')
+        return response
+
+    def is_pinned(self, request):
+        try:
+            return float(request.COOKIES.get(PIN_COOKIE_NAME, 0)) > time.time()
+        except ValueError:
+            return False
+
+
+# -------------------- 로컬 복제본 (SQLite 스냅샷) --------------------
+
+def snapshot_sqlite(source_path, target_path):
+    """ SQLite 온라인 백업 API로 스냅샷을 만든 뒤 원자적으로 교체합니다. """
+    temp_path = f'{target_path}.tmp'
+    source = sqlite3.connect(source_path)
+    target = sqlite3.connect(temp_path)
+    try:
+        # 페이지 단위로 나눠 복사하므로 기본 DB의 쓰기를 오래 막지 않습니다.
+        source.backup(target, pages=1024)
+    finally:
+        target.close()
+        source.close()
+    os.replace(temp_path, target_path)
@@ -0,0 +1,53 @@
+# core/jinja2env.py
+
+"""
+핫 템플릿(task_list, task_detail)용 Jinja2 환경
+
+settings 의 Jinja2 백엔드가 OPTIONS['environment'] 로 사용합니다.
+Django 템플릿과 같은 결과가 나오도록 url(), static() 과 date / linebreaksbr / truncatechars 필터를 제공하고,
+컴파일된 바이트코드는 파일 캐시에 저장해 워커 재시작 후에도 다시 파싱하지 않습니다.
+"""
+
+import os
+import tempfile
+
+from django.conf import settings
+from django.template import defaultfilters
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils.timezone import template_localtime
+from jinja2 import Environment, FileSystemBytecodeCache
+
+BYTECODE_CACHE_DIR = getattr(
+    settings, 'JINJA2_BYTECODE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'side_hoo-jinja2-cache')
+)
+
+
+def url(name, *args, **kwargs):
+    """ {% url %} 과 같은 역할: url('task_detail', pk=task.pk) """
+    return reverse(name, args=args or None, kwargs=kwargs or None)
+
+
+def date(value, arg=None):
+    # Django 템플릿 엔진처럼 현재 시간대로 바꾼 뒤 형식을 적용합니다.
+    return defaultfilters.date(template_localtime(value), arg)
+
+
+def linebreaksbr(value):
+    return defaultfilters.linebreaksbr(value, autoescape=True)
+
+
+def environment(**options):
+    os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
+    options.setdefault('bytecode_cache', FileSystemBytecodeCache(BYTECODE_CACHE_DIR))
+    env = Environment(**options)
+    env.globals.update({
+        'url': url,
+        'static': static,
+    })
+    env.filters.update({
+        'date': date,
+        'linebreaksbr': linebreaksbr,
+        'truncatechars': defaultfilters.truncatechars,
+    })
+    return env
@@ -0,0 +1,159 @@
+# core/leaderboard.py
+
+"""
+도우미 리더보드 (전체 / 주간 / 월간)
+
+- LeaderboardEntry 행은 심부름 완료, 리뷰 작성 트랜잭션 안에서 F() 연산으로 증분 갱신됩니다.
+- 상위 N명 목록은 캐시에 크기가 제한된 정렬 리스트로 유지되며, 커밋 이후에만 반영됩니다.
+- "내 순위"는 캐시된 상위 N 목록에 있으면 그 위치를, 없으면 (period, bucket, -score, ...) 인덱스 범위에서
+  나보다 앞선 행 수를 세어 구합니다. 이 COUNT 는 순위만큼의 인덱스 항목을 읽으므로 O(순위) 입니다.
+  (순서 통계 트리 대신 의도적으로 선택: 인덱스만 읽는 COUNT 는 수십만 행까지 수 ms 이내이고,
+  점수 분포 테이블을 따로 유지하면 완료/리뷰 쓰기마다 갱신할 행이 늘어납니다)
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import LeaderboardEntry, rounded_rating
+
+# 캐시에 유지할 상위 도우미 수
+LEADERBOARD_SIZE = getattr(settings, 'LEADERBOARD_SIZE', 50)
+
+# 캐시 만료 시간 (초). 다른 워커와의 갱신 경합이 있더라도 만료 후 DB 기준으로 다시 만들어집니다.
+LEADERBOARD_CACHE_TIMEOUT = getattr(settings, 'LEADERBOARD_CACHE_TIMEOUT', 300)
+
+ENTRY_FIELDS = ('user_id', 'user__username', 'score', 'tasks_completed', 'rating_sum', 'rating_count')
+
+
+# -------------------- 기간 키 계산 --------------------
+
+def current_bucket(period, when=None):
+    """ 주어진 시각(기본: 현재)이 속한 기간 키를 반환합니다. """
+    today = timezone.localdate(when)
+    if period == 'week':
+        year, week, _ = today.isocalendar()
+        return f'{year}-W{week:02d}'
+    if period == 'month':
+        return today.strftime('%Y-%m')
+    return ''
+
+
+def current_buckets(when=None):
+    return [(period, current_bucket(period, when)) for period, _ in LeaderboardEntry.PERIOD_CHOICES]
+
+
+def _sort_key(row):
+    return (-row['score'], -row['tasks_completed'], row['user_id'])
+
+
+def _entry_row(entry):
+    return {'user_id': entry.user_id, 'score': entry.score, 'tasks_completed': entry.tasks_completed}
+
+
+def _cache_key(period, bucket):
+    return f'leaderboard:{period}:{bucket}'
+
+
+# -------------------- 증분 갱신 --------------------
+
+def _bump(user_id, when=None, create=True, **deltas):
+    """
+    when 시각이 속한 모든 기간의 버킷에 deltas 만큼 값을 더하고, 커밋 후 캐시를 갱신합니다.
+    create=False 면 행이 없을 때 새로 만들지 않습니다. (값을 빼는 경우)
+    """
+    buckets = current_buckets(when)
+    expressions = {field: F(field) + value for field, value in deltas.items()}
+
+    for period, bucket in buckets:
+        entries = LeaderboardEntry.objects.filter(period=period, bucket=bucket, user_id=user_id)
+        if entries.update(**expressions) or not create:
+            continue
+        try:
+            with transaction.atomic():
+                LeaderboardEntry.objects.create(period=period, bucket=bucket, user_id=user_id, **deltas)
+        except IntegrityError:
+            # 동시에 다른 요청이 먼저 행을 만든 경우
+            entries.update(**expressions)
+
+    transaction.on_commit(lambda: _refresh_cached_entries(user_id, buckets))
+
+
+def record_completion(user, reward):
+    """ 심부름 완료 시 도우미의 포인트/완료 수를 반영합니다. (task_complete 트랜잭션 안에서 호출) """
+    _bump(user.pk, score=reward, tasks_completed=1)
+
+
+def record_review(user_id, rating, written_at, count=1):
+    """ 리뷰 대상자의 별점 합계/개수를 리뷰 작성 시각의 버킷에 반영합니다. 리뷰를 빼려면 count=-1. """
+    _bump(user_id, when=written_at, create=count > 0, rating_sum=rating * count, rating_count=count)
+
+
+def _refresh_cached_entries(user_id, buckets):
+    """ 갱신된 행을 캐시된 상위 N 목록에 병합합니다. 캐시가 없으면 다음 조회 때 새로 만듭니다. """
+    for period, bucket in buckets:
+        key = _cache_key(period, bucket)
+        top = cache.get(key)
+        if top is None:
+            continue
+
+        row = (
+            LeaderboardEntry.objects
+            .filter(period=period, bucket=bucket, user_id=user_id)
+            .values(*ENTRY_FIELDS)
+            .first()
+        )
+        if row is None:
+            continue
+
+        top = [entry for entry in top if entry['user_id'] != user_id]
+        if len(top) < LEADERBOARD_SIZE or _sort_key(row) < _sort_key(top[-1]):
+            top.append(row)
+            top.sort(key=_sort_key)
+            del top[LEADERBOARD_SIZE:]
+        cache.set(key, top, LEADERBOARD_CACHE_TIMEOUT)
+
+
+# -------------------- 조회 --------------------
+
+def top_helpers(period='all', limit=None):
+    """ 현재 기간의 상위 도우미 목록 (dict 리스트) 을 반환합니다. """
+    bucket = current_bucket(period)
+    key = _cache_key(period, bucket)
+    top = cache.get(key)
+    if top is None:
+        top = list(
+            LeaderboardEntry.objects
+            .filter(period=period, bucket=bucket)
+            .order_by('-score', '-tasks_completed', 'user_id')
+            .values(*ENTRY_FIELDS)[:LEADERBOARD_SIZE]
+        )
+        cache.set(key, top, LEADERBOARD_CACHE_TIMEOUT)
+
+    rows = top[:limit] if limit else top
+    for rank, row in enumerate(rows, start=1):
+        row['rank'] = rank
+        row['average_rating'] = rounded_rating(row['rating_sum'], row['rating_count'])
+    return rows
+
+
+def rank_of(user, period='all'):
+    """ (순위, LeaderboardEntry) 를 반환합니다. 해당 기간 기록이 없으면 (None, None). """
+    bucket = current_bucket(period)
+    entry = LeaderboardEntry.objects.filter(period=period, bucket=bucket, user=user).first()
+    if entry is None:
+        return None, None
+
+    # 상위 N 안이면 캐시된 목록의 위치가 곧 순위입니다. (인덱스를 세지 않음)
+    for rank, row in enumerate(cache.get(_cache_key(period, bucket)) or [], start=1):
+        if row['user_id'] == entry.user_id and _sort_key(row) == _sort_key(_entry_row(entry)):
+            return rank, entry
+
+    ahead = LeaderboardEntry.objects.filter(period=period, bucket=bucket).filter(
+        Q(score__gt=entry.score)
+        | Q(score=entry.score, tasks_completed__gt=entry.tasks_completed)
+        | Q(score=entry.score, tasks_completed=entry.tasks_completed, user_id__lt=entry.user_id)
+    ).count()
+    return ahead + 1, entry
@@ -0,0 +1,31 @@
+# core/management/commands/_bench.py
+# 벤치마크 관리 명령(bench_*)의 공통 도우미입니다. (밑줄로 시작하므로 명령으로 등록되지 않습니다)
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+@contextmanager
+def temporary_database(alias=DEFAULT_DB_ALIAS):
+    """
+    벤치마크용 임시 SQLite 파일 DB를 만들어 마이그레이션하고, 끝나면 삭제합니다.
+    실제 db.sqlite3 는 건드리지 않으며, 여러 스레드가 같은 파일을 공유할 수 있습니다.
+    """
+    temp_dir = tempfile.mkdtemp(prefix='bench-')
+    connection = connections[alias]
+    test_settings = connection.settings_dict.setdefault('TEST', {})
+    previous_test_name = test_settings.get('NAME')
+    test_settings['NAME'] = os.path.join(temp_dir, f'{alias}.sqlite3')
+
+    original_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield test_settings['NAME']
+    finally:
+        connections.close_all()
+        connection.creation.destroy_test_db(original_name, verbosity=0)
+        test_settings['NAME'] = previous_test_name
+        shutil.rmtree(temp_dir, ignore_errors=True)
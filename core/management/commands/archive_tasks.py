@@ -0,0 +1,22 @@
+# core/management/commands/archive_tasks.py
+
+from django.core.management.base import BaseCommand
+
+from core.archive import ARCHIVE_BATCH_SIZE, ARCHIVE_RETENTION_DAYS, archive_tasks
+
+
+class Command(BaseCommand):
+    help = '보존 기간이 지난 완료/마감 심부름과 지원 기록을 배치 단위로 보관 테이블로 옮깁니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=ARCHIVE_RETENTION_DAYS, help='완료/마감 후 메인 테이블에 남겨둘 기간 (일)')
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE, help='한 트랜잭션에서 옮길 심부름 수')
+        parser.add_argument('--max-batches', type=int, default=None, help='한 번 실행에서 처리할 최대 배치 수')
+
+    def handle(self, *args, **options):
+        moved = archive_tasks(
+            retention_days=options['days'],
+            batch_size=options['batch_size'],
+            max_batches=options['max_batches'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'{moved}개 심부름을 보관 테이블로 옮겼습니다.'))
@@ -0,0 +1,160 @@
+# core/management/commands/bench_apply.py
+
+import json
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, OperationalError, connections, transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from core.models import Task, TaskApplication, UserProfile
+
+from ._bench import temporary_database
+
+User = get_user_model()
+
+
+def legacy_apply(task_id, applicant_id):
+    """ 이전 task_apply 의 흐름 (조회 → 별점 → 중복 확인 → 상태 확인 → 생성) """
+    with transaction.atomic():
+        task = Task.objects.get(pk=task_id)
+        if task.registrant_id == applicant_id:
+            return TaskApplication.NOT_ELIGIBLE
+        if task.min_rating_required > 0:
+            if UserProfile.objects.get(user_id=applicant_id).average_rating < task.min_rating_required:
+                return TaskApplication.NOT_ELIGIBLE
+        if TaskApplication.objects.filter(task=task, applicant_id=applicant_id).exists():
+            return TaskApplication.DUPLICATE
+        if task.status != 'open':
+            return TaskApplication.NOT_ELIGIBLE
+        TaskApplication.objects.create(task=task, applicant_id=applicant_id, status='pending')
+        return TaskApplication.APPLIED
+
+
+class Command(BaseCommand):
+    help = (
+        '인기 심부름에 지원이 몰리는 상황에서 task_apply 처리량을 이전 방식과 단일 INSERT ... SELECT 방식으로 비교하고, '
+        '중복 지원이나 마감된 심부름 지원이 생기지 않았는지 검증합니다. (임시 DB 사용)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--tasks', type=int, default=4, help='지원이 몰리는 인기 심부름 수')
+        parser.add_argument('--repeat', type=int, default=2, help='사용자마다 같은 심부름에 지원을 누르는 횟수 (중복 클릭)')
+        parser.add_argument('--json', action='store_true')
+
+    def seed(self, options):
+        users = User.objects.bulk_create([User(username=f'bench{i}') for i in range(options['users'] + 1)])
+        registrant, applicants = users[0], users[1:]
+        # bulk_create 는 post_save 시그널을 보내지 않으므로 프로필을 직접 만듭니다. (절반은 별점 4.5, 절반은 2.0)
+        UserProfile.objects.bulk_create([
+            UserProfile(user=user, review_count=2, rating_sum=9 if i % 2 else 4) for i, user in enumerate(users)
+        ])
+        due_date = timezone.now() + timedelta(days=7)
+        tasks = Task.objects.bulk_create([
+            Task(title=f'인기 심부름 {i}', content='내용', reward_points=10, location='교내', due_date=due_date,
+                 registrant=registrant, min_rating_required=4 if i % 2 else 0)
+            for i in range(options['tasks'])
+        ])
+        return registrant.pk, [user.pk for user in applicants], [task.pk for task in tasks]
+
+    def run_mode(self, apply, registrant_id, applicant_ids, task_ids, options):
+        TaskApplication.objects.all().delete()
+        Task.objects.filter(pk__in=task_ids).update(status='open', closed_at=None)
+
+        attempts = [
+            (task_id, applicant_id)
+            for task_id in task_ids
+            for applicant_id in applicant_ids + [registrant_id]
+            for _ in range(options['repeat'])
+        ]
+        random.Random(0).shuffle(attempts)
+        chunks = [attempts[i::options['threads']] for i in range(options['threads'])]
+        # 절반쯤 진행되면 인기 심부름 절반을 마감합니다. (마감 후 지원이 새지 않는지 확인)
+        close_after = len(attempts) // 2
+        done = Counter()
+        lock = threading.Lock()
+        closed_ids = task_ids[::2]
+        # 마감 트랜잭션이 쓰기 잠금을 잡은 시점의 마지막 지원 id. 이보다 큰 id 는 마감이 커밋된 뒤에 들어온 지원입니다.
+        # (applied_at / closed_at 은 잠금을 기다리기 전 벽시계 시각이라 커밋 순서를 나타내지 못합니다)
+        serialization_point = {}
+
+        def close_half():
+            with transaction.atomic():
+                Task.objects.filter(pk__in=closed_ids).update(status='expired', closed_at=timezone.now())
+                serialization_point['max_id'] = TaskApplication.objects.aggregate(max_id=Max('id'))['max_id'] or 0
+
+        def worker(chunk):
+            counts = Counter()
+            for task_id, applicant_id in chunk:
+                try:
+                    counts[apply(task_id, applicant_id)] += 1
+                except IntegrityError:
+                    counts['integrity_error'] += 1
+                except OperationalError:
+                    counts['locked'] += 1
+                with lock:
+                    done['attempts'] += 1
+                    should_close = done['attempts'] == close_after
+                if should_close:
+                    close_half()
+            connections.close_all()
+            return counts
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(options['threads']) as pool:
+            total = sum(pool.map(worker, chunks), Counter())
+        elapsed = time.perf_counter() - started
+
+        duplicates = (
+            TaskApplication.objects.values('task', 'applicant').annotate(n=Count('id')).filter(n__gt=1).count()
+        )
+        after_close = TaskApplication.objects.filter(
+            task_id__in=closed_ids, id__gt=serialization_point['max_id']
+        ).count()
+        own_task = TaskApplication.objects.filter(applicant_id=registrant_id).count()
+        return {
+            'attempts': len(attempts),
+            'attempts_per_sec': round(len(attempts) / elapsed, 1),
+            'applies_per_sec': round(total[TaskApplication.APPLIED] / elapsed, 1),
+            'results': dict(total),
+            'duplicates': duplicates,
+            'applied_after_close': after_close,
+            'own_task_applies': own_task,
+        }
+
+    def handle(self, *args, **options):
+        with temporary_database():
+            registrant_id, applicant_ids, task_ids = self.seed(options)
+            report = {
+                'legacy': self.run_mode(legacy_apply, registrant_id, applicant_ids, task_ids, options),
+                'single_statement': self.run_mode(TaskApplication.apply, registrant_id, applicant_ids, task_ids, options),
+            }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.print_report(report, options)
+
+        # 이전 방식은 비교용으로 수치만 보여주고, 새 방식에서 위반이 있으면 0 이 아닌 종료 코드로 끝냅니다.
+        values = report['single_statement']
+        violations = {key: values[key] for key in ('duplicates', 'applied_after_close', 'own_task_applies') if values[key]}
+        if violations:
+            raise CommandError(f'single_statement 불변 조건 위반: {violations}')
+
+    def print_report(self, report, options):
+        self.stdout.write(f"스레드 {options['threads']}개, 지원자 {options['users']}명, 인기 심부름 {options['tasks']}개")
+        for mode, values in report.items():
+            self.stdout.write(
+                f"{mode:17} 시도 {values['attempts_per_sec']:>8}/s  지원 {values['applies_per_sec']:>7}/s  "
+                f"중복 {values['duplicates']}  마감 후 지원 {values['applied_after_close']}  본인 공고 {values['own_task_applies']}  "
+                f"결과 {values['results']}"
+            )
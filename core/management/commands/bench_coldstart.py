@@ -0,0 +1,82 @@
+# core/management/commands/bench_coldstart.py
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# 새 파이썬 프로세스(= 새 워커)에서 실행되는 측정 코드
+CHILD_SCRIPT = r'''
+import io, json, os, sys, time
+
+started = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+import config.wsgi
+import_ms = (time.perf_counter() - started) * 1000
+
+
+def request(path):
+    environ = {
+        'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '',
+        'SERVER_NAME': 'localhost', 'SERVER_PORT': '80', 'HTTP_HOST': 'localhost',
+        'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr,
+        'wsgi.version': (1, 0), 'wsgi.multithread': False, 'wsgi.multiprocess': True, 'wsgi.run_once': False,
+    }
+    status = []
+    begin = time.perf_counter()
+    body = config.wsgi.application(environ, lambda s, h, e=None: status.append(s))
+    first_chunk = next(iter(body), b'')
+    ttfb_ms = (time.perf_counter() - begin) * 1000
+    for _ in body:
+        pass
+    body.close()
+    return status[0], ttfb_ms, len(first_chunk)
+
+
+first_status, first_ms, _ = request(sys.argv[1])
+_, second_ms, _ = request(sys.argv[1])
+print(json.dumps({'status': first_status, 'import_ms': import_ms, 'first_ttfb_ms': first_ms, 'second_ttfb_ms': second_ms}))
+'''
+
+
+class Command(BaseCommand):
+    help = '새 워커 프로세스의 임포트 시간과 첫 요청 TTFB 를 예열 사용/미사용으로 나눠 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=5, help='측정할 워커(프로세스) 수')
+        parser.add_argument('--path', default='/', help='첫 요청 경로 (GET)')
+        parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+
+    def run_worker(self, path, warmup):
+        env = {**os.environ, 'DJANGO_WARMUP': '1' if warmup else '0', 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings')}
+        output = subprocess.run(
+            [sys.executable, '-c', CHILD_SCRIPT, path],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def handle(self, *args, **options):
+        report = {}
+        for warmup in (False, True):
+            runs = [self.run_worker(options['path'], warmup) for _ in range(options['workers'])]
+            label = 'warmup' if warmup else 'cold'
+            report[label] = {
+                metric: round(statistics.median(run[metric] for run in runs), 2)
+                for metric in ('import_ms', 'first_ttfb_ms', 'second_ttfb_ms')
+            }
+            report[label]['status'] = runs[0]['status']
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
+            return
+
+        self.stdout.write(f"경로 {options['path']} / 워커 {options['workers']}개 (중앙값, ms)")
+        self.stdout.write(f"{'':8} {'임포트':>10} {'첫 TTFB':>10} {'두번째 TTFB':>12}")
+        for label, values in report.items():
+            self.stdout.write(
+                f"{label:8} {values['import_ms']:>10.2f} {values['first_ttfb_ms']:>10.2f} {values['second_ttfb_ms']:>12.2f}"
+            )
@@ -0,0 +1,110 @@
+# core/management/commands/bench_replica.py
+
+import json
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.utils import timezone
+
+from core.db_router import REPLICA_DB_ALIAS, replica_reads, snapshot_sqlite
+from core.models import Task
+
+from ._bench import temporary_database
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = '읽기/쓰기 혼합 부하의 처리량을 기본 DB 단독 vs 복제본 라우팅으로 비교합니다. (임시 DB 사용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--seconds', type=float, default=5.0, help='모드별 측정 시간')
+        parser.add_argument('--write-ratio', type=float, default=0.1, help='전체 작업 중 쓰기 비율')
+        parser.add_argument('--tasks', type=int, default=2000, help='미리 넣어둘 심부름 수')
+        parser.add_argument('--json', action='store_true')
+
+    def seed(self, task_count):
+        users = User.objects.bulk_create([User(username=f'bench{i}') for i in range(50)])
+        due_date = timezone.now() + timedelta(days=7)
+        Task.objects.bulk_create([
+            Task(title=f'벤치 심부름 {i}', content='내용', reward_points=10, location='교내',
+                 due_date=due_date, registrant=users[i % len(users)])
+            for i in range(task_count)
+        ], batch_size=500)
+        return [user.pk for user in users]
+
+    def run_mode(self, use_replica, user_ids, options):
+        deadline = time.perf_counter() + options['seconds']
+        due_date = timezone.now() + timedelta(days=7)
+
+        def worker(seed):
+            rng = random.Random(seed)
+            counts = Counter()
+            with replica_reads(allowed=use_replica):
+                while time.perf_counter() < deadline:
+                    try:
+                        if rng.random() < options['write_ratio']:
+                            Task.objects.create(
+                                title='쓰기', content='내용', reward_points=10, location='교내',
+                                due_date=due_date, registrant_id=rng.choice(user_ids),
+                            )
+                            counts['writes'] += 1
+                        else:
+                            # task_list 의 공개 목록과 같은 형태의 읽기
+                            list(Task.objects.filter(status='open').select_related('registrant').order_by('-created_at')[:20])
+                            counts['reads'] += 1
+                    except OperationalError:
+                        counts['errors'] += 1
+            connections.close_all()
+            return counts
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(options['threads']) as pool:
+            total = sum(pool.map(worker, range(options['threads'])), Counter())
+        elapsed = time.perf_counter() - started
+        return {
+            'reads_per_sec': round(total['reads'] / elapsed, 1),
+            'writes_per_sec': round(total['writes'] / elapsed, 1),
+            'ops_per_sec': round((total['reads'] + total['writes']) / elapsed, 1),
+            'errors': total['errors'],
+        }
+
+    def handle(self, *args, **options):
+        with temporary_database() as primary_path:
+            user_ids = self.seed(options['tasks'])
+
+            # 복제본 별칭을 임시 스냅샷 파일로 등록합니다. (기존 설정은 끝나면 복원)
+            replica_path = os.path.join(os.path.dirname(primary_path), 'replica.sqlite3')
+            connections.close_all()
+            snapshot_sqlite(primary_path, replica_path)
+            previous = connections.settings.get(REPLICA_DB_ALIAS)
+            connections.settings[REPLICA_DB_ALIAS] = dict(connections[DEFAULT_DB_ALIAS].settings_dict, NAME=replica_path)
+            try:
+                report = {
+                    'primary_only': self.run_mode(False, user_ids, options),
+                    'with_replica': self.run_mode(True, user_ids, options),
+                }
+            finally:
+                connections[REPLICA_DB_ALIAS].close()
+                if previous is None:
+                    del connections.settings[REPLICA_DB_ALIAS]
+                else:
+                    connections.settings[REPLICA_DB_ALIAS] = previous
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        self.stdout.write(f"스레드 {options['threads']}개, 쓰기 비율 {options['write_ratio']:.0%}, 모드별 {options['seconds']}초")
+        for mode, values in report.items():
+            self.stdout.write(
+                f"{mode:13} 읽기 {values['reads_per_sec']:>9}/s  쓰기 {values['writes_per_sec']:>7}/s  "
+                f"전체 {values['ops_per_sec']:>9}/s  오류 {values['errors']}"
+            )
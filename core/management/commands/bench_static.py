@@ -0,0 +1,109 @@
+# core/management/commands/bench_static.py
+
+import json
+import re
+import shutil
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from django.urls import reverse
+
+from core.static_assets import StaticFilesMiddleware
+
+from ._bench import temporary_database
+
+ASSET_RE = re.compile(r'(?:href|src)="(/static/[^"]+)"')
+
+PROFILES = {
+    'baseline': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    'production': 'core.static_assets.CompressedManifestStaticFilesStorage',
+}
+
+SCENARIOS = (
+    # (이름, 저장소 프로필, Accept-Encoding)
+    ('baseline', 'baseline', ''),
+    ('production_gzip', 'production', 'gzip, deflate'),
+    ('production_br', 'production', 'gzip, deflate, br'),
+)
+
+
+def page_urls():
+    """ 측정할 페이지: 메인 페이지와 정적 파일이 많은 관리자 로그인 페이지 """
+    return [reverse('home'), reverse('admin:login')]
+
+
+def fetch(middleware, url, headers):
+    response = middleware(RequestFactory().get(url, headers=headers))
+    body = b''.join(response.streaming_content) if response.streaming else response.content
+    if hasattr(response, 'close'):
+        response.close()
+    return response, len(body)
+
+
+class Command(BaseCommand):
+    help = '메인 페이지와 관리자 로그인 페이지를 한 번 로드할 때 필요한 정적 파일 전송량을 기본 설정과 운영 정적 프로필(해시 + 사전 압축 + immutable)로 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true')
+
+    def page_load(self, profile, accept_encoding):
+        """ 임시 STATIC_ROOT 에 collectstatic 후 첫 방문/재방문의 요청 수와 전송 바이트를 잽니다. """
+        static_root = tempfile.mkdtemp(prefix='bench-static-')
+        storages = {
+            'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+            'staticfiles': {'BACKEND': PROFILES[profile]},
+        }
+        try:
+            # DEBUG 에서는 매니페스트 저장소도 해시 없는 URL 을 돌려주므로 운영과 같게 끕니다.
+            with override_settings(DEBUG=False, ALLOWED_HOSTS=['testserver'], STATIC_ROOT=static_root, STORAGES=storages):
+                call_command('collectstatic', interactive=False, verbosity=0)
+
+                client = Client()
+                html = ''.join(client.get(url).content.decode() for url in page_urls())
+                assets = sorted(set(ASSET_RE.findall(html)))
+
+                middleware = StaticFilesMiddleware(lambda request: HttpResponse(status=404))
+                headers = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+
+                first = {'requests': 0, 'bytes': 0}
+                last_modified = {}
+                for url in assets:
+                    response, size = fetch(middleware, url, headers)
+                    first['requests'] += 1
+                    first['bytes'] += size
+                    last_modified[url] = response
+
+                # 재방문: immutable 이면 브라우저가 요청하지 않고, 아니면 조건부 요청(304)을 보냅니다.
+                repeat = {'requests': 0, 'bytes': 0}
+                for url, response in last_modified.items():
+                    if 'immutable' in response.get('Cache-Control', ''):
+                        continue
+                    revalidated, size = fetch(middleware, url, {**headers, 'If-Modified-Since': response['Last-Modified']})
+                    repeat['requests'] += 1
+                    repeat['bytes'] += size
+
+                return {
+                    'assets': assets,
+                    'first_visit': first,
+                    'repeat_visit': repeat,
+                }
+        finally:
+            shutil.rmtree(static_root, ignore_errors=True)
+
+    def handle(self, *args, **options):
+        with temporary_database():
+            report = {name: self.page_load(profile, encoding) for name, profile, encoding in SCENARIOS}
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        self.stdout.write('외부 CDN(Bootstrap) 파일은 제외한, 이 서버가 서빙하는 정적 파일 기준입니다.')
+        self.stdout.write(f"{'시나리오':18} {'파일':>4} {'첫 방문 요청':>10} {'첫 방문 바이트':>12} {'재방문 요청':>10} {'재방문 바이트':>12}")
+        for name, values in report.items():
+            self.stdout.write(
+                f"{name:18} {len(values['assets']):>4} {values['first_visit']['requests']:>10} {values['first_visit']['bytes']:>12} "
+                f"{values['repeat_visit']['requests']:>10} {values['repeat_visit']['bytes']:>12}"
+            )
@@ -0,0 +1,100 @@
+# core/management/commands/bench_templates.py
+
+import json
+import timeit
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template import engines
+from django.template.backends.jinja2 import Jinja2
+from django.test import RequestFactory
+from django.utils import timezone
+
+from core.models import Task, TaskApplication, TaskReview
+
+User = get_user_model()
+
+SIZES = (10, 100, 1000)
+
+
+def jinja2_engine():
+    """ 설정에 Jinja2 엔진이 있으면 그것을, 없으면 같은 옵션으로 만든 엔진을 사용합니다. """
+    for engine in engines.all():
+        if isinstance(engine, Jinja2):
+            return engine
+    django_options = engines['django'].engine
+    return Jinja2({
+        'NAME': 'jinja2-bench',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'environment': 'core.jinja2env.environment',
+            'context_processors': list(django_options.context_processors),
+        },
+    })
+
+
+def build_contexts(size):
+    """ DB 없이 렌더링할 수 있도록 저장하지 않은 객체로 컨텍스트를 만듭니다. """
+    now = timezone.now()
+    registrant = User(pk=1, username='registrant')
+    tasks = [
+        Task(pk=i, title=f'심부름 {i}', content='편의점에서 간식 사다주세요.\n감사합니다!', reward_points=100,
+             location='기숙사 1층', status='open', created_at=now, due_date=now + timedelta(days=1), registrant=registrant)
+        for i in range(1, size + 1)
+    ]
+    applications = [
+        TaskApplication(pk=i, task=tasks[0], applicant=User(pk=i + 1, username=f'helper{i}'), status='pending')
+        for i in range(1, size + 1)
+    ]
+    task_list = {
+        'tasks': tasks,
+        'current_min_rating': None,
+        'rating_choices': TaskReview.RATING_CHOICES,
+        'current_gender': 'A',
+        'gender_choices': Task.GENDER_CHOICES,
+    }
+    task_detail = {
+        'task': tasks[0],
+        'has_applied': False,
+        'applications': applications,
+        'is_registrant': True,
+        'review_possible': False,
+    }
+    return {'core/task_list.html': task_list, 'core/task_detail.html': task_detail}
+
+
+class Command(BaseCommand):
+    help = '핫 템플릿(task_list, task_detail)의 렌더링 시간을 Django 엔진과 Jinja2 엔진으로 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20, help='크기별 반복 렌더링 횟수')
+        parser.add_argument('--json', action='store_true')
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get('/')
+        request.user = AnonymousUser()
+        template_engines = {'django': engines['django'], 'jinja2': jinja2_engine()}
+
+        report = []
+        for size in SIZES:
+            for template_name, context in build_contexts(size).items():
+                row = {'template': template_name, 'size': size}
+                for engine_name, engine in template_engines.items():
+                    template = engine.get_template(template_name)
+                    template.render(context, request)  # 첫 렌더링(컴파일/캐시)은 측정에서 제외
+                    seconds = min(timeit.repeat(lambda: template.render(context, request), number=1, repeat=options['repeat']))
+                    row[f'{engine_name}_ms'] = round(seconds * 1000, 3)
+                row['speedup'] = round(row['django_ms'] / row['jinja2_ms'], 2) if row['jinja2_ms'] else None
+                report.append(row)
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        self.stdout.write(f"{'템플릿':24} {'크기':>6} {'django(ms)':>12} {'jinja2(ms)':>12} {'배율':>6}")
+        for row in report:
+            self.stdout.write(
+                f"{row['template']:24} {row['size']:>6} {row['django_ms']:>12} {row['jinja2_ms']:>12} {row['speedup']:>6}"
+            )
@@ -0,0 +1,13 @@
+# core/management/commands/publish_feed.py
+
+from django.core.management.base import BaseCommand
+
+from core.snapshots import FEED_SNAPSHOT_ROOT, publish_feed_snapshots
+
+
+class Command(BaseCommand):
+    help = '로그인하지 않은 방문자용 공개 심부름 피드 HTML/JSON 스냅샷을 다시 발행합니다. (cron 등으로 주기 실행)'
+
+    def handle(self, *args, **options):
+        written = publish_feed_snapshots()
+        self.stdout.write(self.style.SUCCESS(f'{written}개 페이지 스냅샷을 {FEED_SNAPSHOT_ROOT} 에 발행했습니다.'))
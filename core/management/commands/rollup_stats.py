@@ -0,0 +1,26 @@
+# core/management/commands/rollup_stats.py
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from core.rollups import DEFAULT_LAG, run_rollups
+
+
+class Command(BaseCommand):
+    help = '워터마크 이후 구간만 다시 집계해 시간별/일별 운영 통계 롤업을 갱신합니다. (cron 등으로 주기 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lag-seconds', type=int, default=int(DEFAULT_LAG.total_seconds()),
+            help='워터마크보다 이만큼 앞선 시점부터 다시 집계합니다. (늦게 커밋된 트랜잭션 대비)',
+        )
+        parser.add_argument(
+            '--rebuild', action='store_true',
+            help='워터마크를 초기화하고 전체 기간을 다시 집계합니다.',
+        )
+
+    def handle(self, *args, **options):
+        results = run_rollups(lag=timedelta(seconds=options['lag_seconds']), rebuild=options['rebuild'])
+        for granularity, count in results.items():
+            self.stdout.write(self.style.SUCCESS(f'{granularity}: {count}개 구간 갱신'))
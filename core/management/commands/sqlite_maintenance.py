@@ -0,0 +1,53 @@
+# core/management/commands/sqlite_maintenance.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils import timezone
+
+from core import db_maintenance
+
+
+class Command(BaseCommand):
+    help = (
+        'SQLite DB 유지보수: 만료 세션 정리, ANALYZE/PRAGMA optimize, 단계별 점진적 VACUUM 을 실행하고 '
+        '테이블/인덱스 크기, 빈 페이지 비율, core 모델별 행 수를 JSON 으로 출력합니다. (cron 등으로 주기 실행)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+        parser.add_argument('--report-only', action='store_true', help='유지보수 없이 상태 보고만 출력')
+        parser.add_argument('--analysis-limit', type=int, default=db_maintenance.ANALYSIS_LIMIT,
+                            help='ANALYZE 가 인덱스마다 살펴볼 행 수 (0 이면 전체)')
+        parser.add_argument('--vacuum-step-pages', type=int, default=db_maintenance.VACUUM_STEP_PAGES,
+                            help='점진적 VACUUM 한 단계에서 반환할 페이지 수')
+        parser.add_argument('--vacuum-max-steps', type=int, default=None, help='한 번 실행에서 처리할 최대 VACUUM 단계 수')
+        parser.add_argument('--session-batch-size', type=int, default=db_maintenance.SESSION_DELETE_BATCH,
+                            help='만료 세션을 한 번에 지울 개수')
+        parser.add_argument('--enable-incremental-vacuum', action='store_true',
+                            help='auto_vacuum 을 INCREMENTAL 로 전환 (전체 VACUUM 이 한 번 실행되어 DB 가 잠시 잠김)')
+        parser.add_argument('--integrity-check', action='store_true', help='PRAGMA quick_check 결과도 포함')
+
+    def handle(self, *args, **options):
+        using = options['database']
+        if connections[using].vendor != 'sqlite':
+            raise CommandError(f'"{using}" DB 는 SQLite 가 아닙니다.')
+
+        result = {'started_at': timezone.now().isoformat()}
+        if not options['report_only']:
+            if options['enable_incremental_vacuum']:
+                result['incremental_vacuum_enabled'] = db_maintenance.enable_incremental_vacuum(using)
+            # 세션을 먼저 지워야 이번 VACUUM 에서 그 공간까지 반환됩니다.
+            result['expired_sessions_deleted'] = db_maintenance.delete_expired_sessions(
+                using, batch_size=options['session_batch_size'],
+            )
+            result['vacuum_pages_released'] = db_maintenance.incremental_vacuum(
+                using, step_pages=options['vacuum_step_pages'], max_steps=options['vacuum_max_steps'],
+            )
+            result['analyze_ms'] = db_maintenance.analyze(using, analysis_limit=options['analysis_limit'])
+
+        if options['integrity_check']:
+            result['integrity_check'] = db_maintenance.integrity_check(using)
+        result['report'] = db_maintenance.database_report(using)
+        self.stdout.write(json.dumps(result, indent=2, ensure_ascii=False))
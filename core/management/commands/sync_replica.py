@@ -0,0 +1,24 @@
+# core/management/commands/sync_replica.py
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from core.db_router import REPLICA_DB_ALIAS, snapshot_sqlite
+
+
+class Command(BaseCommand):
+    help = '기본 SQLite DB의 스냅샷으로 로컬 읽기 복제본 파일을 갱신합니다. (DJANGO_REPLICA_DB 설정 필요)'
+
+    def handle(self, *args, **options):
+        if REPLICA_DB_ALIAS not in connections.databases:
+            raise CommandError('복제본 DB가 설정되어 있지 않습니다. DJANGO_REPLICA_DB 환경 변수를 지정하세요.')
+
+        primary = connections[DEFAULT_DB_ALIAS].settings_dict
+        replica = connections[REPLICA_DB_ALIAS].settings_dict
+        if primary['ENGINE'] != 'django.db.backends.sqlite3' or replica['ENGINE'] != 'django.db.backends.sqlite3':
+            raise CommandError('로컬 스냅샷 동기화는 SQLite 에서만 지원합니다.')
+
+        # 열려 있는 복제본 연결은 교체 전 파일을 계속 보므로 닫아둡니다.
+        connections[REPLICA_DB_ALIAS].close()
+        snapshot_sqlite(str(primary['NAME']), str(replica['NAME']))
+        self.stdout.write(self.style.SUCCESS(f"{primary['NAME']} → {replica['NAME']} 스냅샷 완료"))
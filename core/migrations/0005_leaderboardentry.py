@@ -0,0 +1,62 @@
+# Generated by Django 6.0 on 2026-10-19 05:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def seed_all_time_entries(apps, schema_editor):
+    """ 기존 프로필/리뷰 데이터로 전체 기간 리더보드를 채웁니다. """
+    UserProfile = apps.get_model('core', 'UserProfile')
+    TaskReview = apps.get_model('core', 'TaskReview')
+    LeaderboardEntry = apps.get_model('core', 'LeaderboardEntry')
+
+    ratings = {
+        row['reviewed_user']: row
+        for row in TaskReview.objects.values('reviewed_user').annotate(total=Sum('rating'), count=Count('id'))
+    }
+    entries = []
+    for profile in UserProfile.objects.all():
+        rating = ratings.get(profile.user_id, {})
+        if not (profile.points or profile.tasks_completed or rating):
+            continue
+        entries.append(LeaderboardEntry(
+            period='all',
+            bucket='',
+            user_id=profile.user_id,
+            score=profile.points,
+            tasks_completed=profile.tasks_completed,
+            rating_sum=rating.get('total') or 0,
+            rating_count=rating.get('count') or 0,
+        ))
+    LeaderboardEntry.objects.bulk_create(entries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_task_min_rating_required_task_required_gender_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('all', '전체'), ('week', '주간'), ('month', '월간')], max_length=5, verbose_name='집계 기간')),
+                ('bucket', models.CharField(blank=True, max_length=10, verbose_name='기간 키')),
+                ('score', models.IntegerField(default=0, verbose_name='획득 포인트')),
+                ('tasks_completed', models.IntegerField(default=0, verbose_name='완료한 심부름 수')),
+                ('rating_sum', models.IntegerField(default=0, verbose_name='받은 별점 합계')),
+                ('rating_count', models.IntegerField(default=0, verbose_name='받은 리뷰 수')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to=settings.AUTH_USER_MODEL, verbose_name='도우미')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['period', 'bucket', '-score', '-tasks_completed', 'user'], name='leaderboard_rank_idx')],
+                'unique_together': {('period', 'bucket', 'user')},
+            },
+        ),
+        migrations.RunPython(seed_all_time_entries, migrations.RunPython.noop),
+    ]
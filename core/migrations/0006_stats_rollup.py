@@ -0,0 +1,62 @@
+# Generated by Django 6.0 on 2026-10-19 05:18
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_closed_at(apps, schema_editor):
+    """ 기존 완료/마감 심부름은 정확한 종료 시각을 알 수 없으므로 등록일로 채웁니다. """
+    Task = apps.get_model('core', 'Task')
+    Task.objects.filter(status__in=['completed', 'expired'], closed_at__isnull=True).update(closed_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_leaderboardentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=20, unique=True, verbose_name='이름')),
+                ('value', models.DateTimeField(verbose_name='반영 완료 시각')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='closed_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='종료 시각'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='등록일'),
+        ),
+        migrations.AlterField(
+            model_name='taskreview',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='작성일'),
+        ),
+        migrations.CreateModel(
+            name='StatsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', '시간별'), ('day', '일별')], max_length=4, verbose_name='집계 단위')),
+                ('bucket_start', models.DateTimeField(verbose_name='구간 시작')),
+                ('tasks_created', models.IntegerField(default=0, verbose_name='등록된 심부름 수')),
+                ('tasks_completed', models.IntegerField(default=0, verbose_name='완료된 심부름 수')),
+                ('tasks_expired', models.IntegerField(default=0, verbose_name='마감된 심부름 수')),
+                ('points_paid', models.IntegerField(default=0, verbose_name='지급된 포인트')),
+                ('rating_sum', models.IntegerField(default=0, verbose_name='별점 합계')),
+                ('rating_count', models.IntegerField(default=0, verbose_name='리뷰 수')),
+            ],
+            options={
+                'ordering': ['-bucket_start'],
+                'unique_together': {('granularity', 'bucket_start')},
+            },
+        ),
+        migrations.RunPython(backfill_closed_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 6.0 on 2026-10-19 05:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_stats_rollup'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTask',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=100, verbose_name='제목')),
+                ('content', models.TextField(verbose_name='상세 내용')),
+                ('reward_points', models.IntegerField(verbose_name='요구 재화(포인트)')),
+                ('location', models.CharField(max_length=200, verbose_name='심부름 위치')),
+                ('status', models.CharField(choices=[('open', '모집 중'), ('assigned', '진행 중'), ('completed', '완료됨'), ('expired', '마감됨')], max_length=10, verbose_name='상태')),
+                ('required_gender', models.CharField(choices=[('A', '성별 무관'), ('M', '남성'), ('F', '여성')], default='A', max_length=1, verbose_name='필수 성별 조건')),
+                ('min_rating_required', models.IntegerField(default=0, verbose_name='최소 별점 조건')),
+                ('created_at', models.DateTimeField(db_index=True, verbose_name='등록일')),
+                ('due_date', models.DateTimeField(verbose_name='마감 기한')),
+                ('closed_at', models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='종료 시각')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='보관일')),
+                ('assigned_to', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_assigned_tasks', to=settings.AUTH_USER_MODEL, verbose_name='할당된 도우미')),
+                ('registrant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_registered_tasks', to=settings.AUTH_USER_MODEL, verbose_name='등록자')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='taskreview',
+            name='archived_task',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='review', to='core.archivedtask', verbose_name='보관된 심부름 공고'),
+        ),
+        migrations.CreateModel(
+            name='ArchivedTaskApplication',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', '대기 중'), ('accepted', '수락됨'), ('rejected', '거절됨')], max_length=10, verbose_name='지원 상태')),
+                ('applied_at', models.DateTimeField(verbose_name='지원 시간')),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applied_tasks', to=settings.AUTH_USER_MODEL, verbose_name='지원자')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='core.archivedtask', verbose_name='심부름 공고')),
+            ],
+            options={
+                'unique_together': {('task', 'applicant')},
+            },
+        ),
+    ]
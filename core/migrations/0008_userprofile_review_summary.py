@@ -0,0 +1,70 @@
+# Generated by Django 6.0 on 2026-10-19 05:22
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_review_summary(apps, schema_editor):
+    """ 기존 리뷰로 프로필의 리뷰 요약 컬럼을 채웁니다. """
+    UserProfile = apps.get_model('core', 'UserProfile')
+    TaskReview = apps.get_model('core', 'TaskReview')
+
+    aggregates = {'review_count': Count('id'), 'rating_sum': Sum('rating')}
+    for star in range(1, 6):
+        aggregates[f'rating_{star}_count'] = Count('id', filter=Q(rating=star))
+
+    for row in TaskReview.objects.values('reviewed_user').annotate(**aggregates).order_by():
+        user_id = row.pop('reviewed_user')
+        UserProfile.objects.filter(user_id=user_id).update(**row)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_task_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='rating_1_count',
+            field=models.IntegerField(default=0, verbose_name='1점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='rating_2_count',
+            field=models.IntegerField(default=0, verbose_name='2점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='rating_3_count',
+            field=models.IntegerField(default=0, verbose_name='3점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='rating_4_count',
+            field=models.IntegerField(default=0, verbose_name='4점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='rating_5_count',
+            field=models.IntegerField(default=0, verbose_name='5점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='rating_sum',
+            field=models.IntegerField(default=0, verbose_name='받은 별점 합계'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='review_count',
+            field=models.IntegerField(default=0, verbose_name='받은 리뷰 수'),
+        ),
+        migrations.AddIndex(
+            model_name='taskreview',
+            index=models.Index(fields=['reviewed_user', '-created_at', '-id'], name='review_received_page_idx'),
+        ),
+        migrations.RunPython(backfill_review_summary, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,21 @@
-from django.db import models
+from django.db import IntegrityError, connections, models, router, transaction
 from django.contrib.auth import get_user_model
 from django.utils import timezone
-from django.db.models import Q, Avg # Avg 임포트 유지
+from django.db.models import F
 
 # Django의 기본 사용자(User) 모델을 가져옵니다.
 User = get_user_model()
 
+def rounded_rating(rating_sum, count):
+    """
+    평균 별점을 소수 첫째 자리로 반올림합니다. (x.x5 는 올림, 정수 연산이라 부동소수점 오차 없음)
+    TaskApplication.apply 의 SQL 최소 별점 조건과 같은 기준입니다.
+    """
+    if not count:
+        return 0.0
+    return (20 * rating_sum + count) // (2 * count) / 10
+
+
 # --- 1. 사용자 프로필 및 재화 (포인트) 모델 (변경 없음) ---
 
 class UserProfile(models.Model):
@@ -18,11 +28,38 @@ class UserProfile(models.Model):
     selected_title = models.CharField(max_length=50, default='🐣 새내기', verbose_name="선택된 칭호")
     bio = models.TextField(blank=True, verbose_name="간단 소개")
 
+    # 받은 리뷰 요약 (core/signals.py 가 리뷰 생성/수정/삭제 때 record_review 로 증분 갱신)
+    review_count = models.IntegerField(default=0, verbose_name="받은 리뷰 수")
+    rating_sum = models.IntegerField(default=0, verbose_name="받은 별점 합계")
+    rating_1_count = models.IntegerField(default=0, verbose_name="1점 리뷰 수")
+    rating_2_count = models.IntegerField(default=0, verbose_name="2점 리뷰 수")
+    rating_3_count = models.IntegerField(default=0, verbose_name="3점 리뷰 수")
+    rating_4_count = models.IntegerField(default=0, verbose_name="4점 리뷰 수")
+    rating_5_count = models.IntegerField(default=0, verbose_name="5점 리뷰 수")
+
     @property
     def average_rating(self):
-        """ 자신이 받은 모든 리뷰의 평균 별점을 계산합니다. """
-        avg_rating = self.user.received_reviews.aggregate(Avg('rating'))['rating__avg']
-        return round(avg_rating, 1) if avg_rating is not None else 0.0
+        """ 자신이 받은 모든 리뷰의 평균 별점 (미리 집계된 요약 컬럼 기준) """
+        return rounded_rating(self.rating_sum, self.review_count)
+
+    @property
+    def rating_histogram(self):
+        """ [(별점, 리뷰 수, 비율%), ...] 5점부터 1점 순서 """
+        histogram = []
+        for star in range(5, 0, -1):
+            count = getattr(self, f'rating_{star}_count')
+            percent = round(count * 100 / self.review_count) if self.review_count else 0
+            histogram.append((star, count, percent))
+        return histogram
+
+    @classmethod
+    def record_review(cls, user_id, rating, count=1):
+        """ 리뷰를 리뷰 대상자의 요약 컬럼에 반영합니다. 리뷰를 빼려면 count=-1. (리뷰 저장과 같은 트랜잭션에서 호출) """
+        cls.objects.filter(user_id=user_id).update(**{
+            'review_count': F('review_count') + count,
+            'rating_sum': F('rating_sum') + rating * count,
+            f'rating_{rating}_count': F(f'rating_{rating}_count') + count,
+        })
     
     @property
     def get_title_badge(self):
@@ -82,18 +119,33 @@ class Task(models.Model):
     # ---------------------------------------------------
     
     # 3. 시간 정보
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name="등록일")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="등록일")
     due_date = models.DateTimeField(verbose_name="마감 기한") 
+    # 완료/마감 상태가 된 시각 (통계 롤업 집계 기준)
+    closed_at = models.DateTimeField(null=True, blank=True, db_index=True, verbose_name="종료 시각")
 
     # 4. 사용자 연결
     registrant = models.ForeignKey(User, on_delete=models.CASCADE, related_name='registered_tasks', verbose_name="등록자")
     assigned_to = models.ForeignKey(User, on_delete=models.SET_NULL, related_name='assigned_tasks', null=True, blank=True, verbose_name="할당된 도우미")
 
+    CLOSED_STATUSES = ('completed', 'expired')
+    is_archived = False
+
+    def save(self, *args, **kwargs):
+        # 완료/마감 상태로 바뀌는 시점을 기록합니다. (관리자 페이지에서 바꾼 경우 포함)
+        if self.status in self.CLOSED_STATUSES and self.closed_at is None:
+            self.closed_at = timezone.now()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"[{self.get_status_display()}] {self.title} by {self.registrant.username}"
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # 공개 피드: status='open' 필터 + 최신순 정렬
+            models.Index(fields=['status', '-created_at'], name='task_status_feed_idx'),
+        ]
 
 
 # --- 3. 심부름 지원 (Task Application) 모델 (변경 없음) ---
@@ -114,9 +166,59 @@ class TaskApplication(models.Model):
     
     applied_at = models.DateTimeField(auto_now_add=True, verbose_name="지원 시간")
 
+    # apply() 결과
+    APPLIED = 'applied'
+    DUPLICATE = 'duplicate'
+    NOT_ELIGIBLE = 'not_eligible'
+
     def __str__(self):
         return f"{self.applicant.username}의 {self.task.title} 지원 - {self.get_status_display()}"
 
+    @classmethod
+    def apply(cls, task_id, applicant_id):
+        """
+        지원 기록을 INSERT ... SELECT 한 문장으로 만듭니다. (지원이 몰려도 왕복 1회)
+        모집 중 여부, 본인 공고 여부, 최소 별점 조건(UserProfile 요약 컬럼)을 같은 문장에서 확인하고,
+        중복 지원은 unique_together('task', 'applicant') 제약이 막습니다.
+        반환값: APPLIED / DUPLICATE / NOT_ELIGIBLE (NOT_ELIGIBLE 이면 호출한 쪽에서 이유를 확인)
+        """
+        using = router.db_for_write(cls)
+        connection = connections[using]
+        qn = connection.ops.quote_name
+        task_table = qn(Task._meta.db_table)
+        profile_table = qn(UserProfile._meta.db_table)
+        applied_at = cls._meta.get_field('applied_at').get_db_prep_value(timezone.now(), connection)
+
+        # 평균 별점은 소수 첫째 자리 반올림 값으로 비교합니다. (rounded_rating 과 같은 기준)
+        # rounded_rating(sum, count) >= min  <=>  (20 * sum + count) // (2 * count) >= 10 * min
+        #                                    <=>  20 * sum >= (20 * min - 1) * count
+        sql = f"""
+            INSERT INTO {qn(cls._meta.db_table)} (task_id, applicant_id, status, applied_at)
+            SELECT t.id, %s, 'pending', %s
+            FROM {task_table} t
+            WHERE t.id = %s
+              AND t.status = 'open'
+              AND t.registrant_id <> %s
+              AND (
+                t.min_rating_required = 0
+                OR EXISTS (
+                    SELECT 1 FROM {profile_table} p
+                    WHERE p.user_id = %s
+                      AND p.review_count > 0
+                      AND 20 * p.rating_sum >= (20 * t.min_rating_required - 1) * p.review_count
+                )
+              )
+        """
+        try:
+            # 바깥 트랜잭션이 있어도 중복 오류가 그 트랜잭션을 깨뜨리지 않도록 세이브포인트 안에서 실행합니다.
+            with transaction.atomic(using=using):
+                with connection.cursor() as cursor:
+                    cursor.execute(sql, [applicant_id, applied_at, task_id, applicant_id, applicant_id])
+                    inserted = cursor.rowcount
+        except IntegrityError:
+            return cls.DUPLICATE
+        return cls.APPLIED if inserted == 1 else cls.NOT_ELIGIBLE
+
     class Meta:
         unique_together = ('task', 'applicant')
 
@@ -141,6 +243,15 @@ class TaskReview(models.Model):
         null=True, 
         blank=True # Task와 연결되지 않은 리뷰 허용
     )
+    # 심부름이 보관(아카이브) 테이블로 옮겨지면 task 대신 이 필드가 연결됩니다.
+    archived_task = models.OneToOneField(
+        'ArchivedTask',
+        on_delete=models.SET_NULL,
+        related_name='review',
+        verbose_name="보관된 심부름 공고",
+        null=True,
+        blank=True,
+    )
     
     # 리뷰 작성자 (공고주 또는 일반 사용자)
     reviewer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='given_reviews', verbose_name="리뷰 작성자")
@@ -154,8 +265,146 @@ class TaskReview(models.Model):
     # 리뷰 내용
     comment = models.TextField(blank=True, verbose_name="리뷰 내용")
     
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name="작성일")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="작성일")
+
+    def __str__(self):
+        task = self.task or self.archived_task
+        task_title = task.title if task else "일반 리뷰"
+        return f"{task_title} - {self.reviewed_user.username}에게 {self.rating}점"
+
+    class Meta:
+        indexes = [
+            # 프로필의 받은 리뷰 목록 (키셋 페이지네이션)
+            models.Index(fields=['reviewed_user', '-created_at', '-id'], name='review_received_page_idx'),
+        ]
+
+# --- 5. 도우미 리더보드 (Leaderboard) 모델 ---
+
+class LeaderboardEntry(models.Model):
+    """
+    기간별(전체/주간/월간) 도우미 누적 성적을 저장하는 모델입니다.
+    심부름 완료·리뷰 작성 시점에 증분 갱신되므로 순위 계산에 프로필 전체 정렬이 필요 없습니다.
+    """
+    PERIOD_CHOICES = [
+        ('all', '전체'),
+        ('week', '주간'),
+        ('month', '월간'),
+    ]
+
+    period = models.CharField(max_length=5, choices=PERIOD_CHOICES, verbose_name="집계 기간")
+    # 기간 구분 키: 전체는 '', 주간은 '2025-W49', 월간은 '2025-12'
+    bucket = models.CharField(max_length=10, blank=True, verbose_name="기간 키")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='leaderboard_entries', verbose_name="도우미")
+
+    score = models.IntegerField(default=0, verbose_name="획득 포인트")
+    tasks_completed = models.IntegerField(default=0, verbose_name="완료한 심부름 수")
+    rating_sum = models.IntegerField(default=0, verbose_name="받은 별점 합계")
+    rating_count = models.IntegerField(default=0, verbose_name="받은 리뷰 수")
+
+    @property
+    def average_rating(self):
+        return rounded_rating(self.rating_sum, self.rating_count)
+
+    def __str__(self):
+        return f"[{self.get_period_display()} {self.bucket}] {self.user_id} - {self.score}P"
+
+    class Meta:
+        unique_together = ('period', 'bucket', 'user')
+        indexes = [
+            # 상위 N명 조회와 "내 순위" 계산이 모두 이 인덱스를 탑니다.
+            models.Index(fields=['period', 'bucket', '-score', '-tasks_completed', 'user'], name='leaderboard_rank_idx'),
+        ]
+
+
+
+# --- 6. 운영 통계 롤업 (Stats Rollup) 모델 ---
+
+class StatsRollup(models.Model):
+    """
+    시간/일 단위로 미리 집계한 운영 통계입니다.
+    rollup_stats 명령이 워터마크 이후 구간만 다시 집계하므로, 통계 조회 비용은 원본 테이블 크기와 무관합니다.
+    """
+    GRANULARITY_CHOICES = [
+        ('hour', '시간별'),
+        ('day', '일별'),
+    ]
+
+    granularity = models.CharField(max_length=4, choices=GRANULARITY_CHOICES, verbose_name="집계 단위")
+    bucket_start = models.DateTimeField(verbose_name="구간 시작")
+
+    tasks_created = models.IntegerField(default=0, verbose_name="등록된 심부름 수")
+    tasks_completed = models.IntegerField(default=0, verbose_name="완료된 심부름 수")
+    tasks_expired = models.IntegerField(default=0, verbose_name="마감된 심부름 수")
+    points_paid = models.IntegerField(default=0, verbose_name="지급된 포인트")
+    rating_sum = models.IntegerField(default=0, verbose_name="별점 합계")
+    rating_count = models.IntegerField(default=0, verbose_name="리뷰 수")
+
+    @property
+    def average_rating(self):
+        if not self.rating_count:
+            return None
+        return round(self.rating_sum / self.rating_count, 2)
 
     def __str__(self):
-        task_title = self.task.title if self.task else "일반 리뷰"
-        return f"{task_title} - {self.reviewed_user.username}에게 {self.rating}점"
\ No newline at end of file
+        return f"[{self.get_granularity_display()}] {self.bucket_start:%Y-%m-%d %H:%M}"
+
+    class Meta:
+        unique_together = ('granularity', 'bucket_start')
+        ordering = ['-bucket_start']
+
+
+class RollupWatermark(models.Model):
+    """ 롤업 집계가 어디까지 반영되었는지 기록합니다. (집계 단위별 1행) """
+    name = models.CharField(max_length=20, unique=True, verbose_name="이름")
+    value = models.DateTimeField(verbose_name="반영 완료 시각")
+
+    def __str__(self):
+        return f"{self.name} @ {self.value}"
+
+
+
+# --- 7. 보관(아카이브) 모델 ---
+# 보존 기간이 지난 완료/마감 심부름은 archive_tasks 명령이 아래 테이블로 옮깁니다.
+# 기본키는 원래 Task/TaskApplication 의 pk 를 그대로 사용하므로 기존 URL(/task/<pk>/)이 유지됩니다.
+
+class ArchivedTask(models.Model):
+    """ 메인 테이블에서 옮겨진 완료/마감 심부름 공고입니다. (읽기 전용) """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=100, verbose_name="제목")
+    content = models.TextField(verbose_name="상세 내용")
+    reward_points = models.IntegerField(verbose_name="요구 재화(포인트)")
+    location = models.CharField(max_length=200, verbose_name="심부름 위치")
+    status = models.CharField(max_length=10, choices=Task.STATUS_CHOICES, verbose_name="상태")
+    required_gender = models.CharField(max_length=1, choices=Task.GENDER_CHOICES, default='A', verbose_name="필수 성별 조건")
+    min_rating_required = models.IntegerField(default=0, verbose_name="최소 별점 조건")
+
+    created_at = models.DateTimeField(db_index=True, verbose_name="등록일")
+    due_date = models.DateTimeField(verbose_name="마감 기한")
+    closed_at = models.DateTimeField(null=True, blank=True, db_index=True, verbose_name="종료 시각")
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name="보관일")
+
+    registrant = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_registered_tasks', verbose_name="등록자")
+    assigned_to = models.ForeignKey(User, on_delete=models.SET_NULL, related_name='archived_assigned_tasks', null=True, blank=True, verbose_name="할당된 도우미")
+
+    is_archived = True
+
+    def __str__(self):
+        return f"[보관 · {self.get_status_display()}] {self.title} by {self.registrant.username}"
+
+    class Meta:
+        ordering = ['-created_at']
+
+
+class ArchivedTaskApplication(models.Model):
+    """ 보관된 심부름의 지원 기록입니다. """
+    id = models.BigIntegerField(primary_key=True)
+    task = models.ForeignKey(ArchivedTask, on_delete=models.CASCADE, related_name='applications', verbose_name="심부름 공고")
+    applicant = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_applied_tasks', verbose_name="지원자")
+    status = models.CharField(max_length=10, choices=TaskApplication.APPLICATION_STATUS_CHOICES, verbose_name="지원 상태")
+    applied_at = models.DateTimeField(verbose_name="지원 시간")
+
+    def __str__(self):
+        return f"{self.applicant.username}의 {self.task.title} 지원 (보관) - {self.get_status_display()}"
+
+    class Meta:
+        unique_together = ('task', 'applicant')
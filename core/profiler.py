@@ -0,0 +1,204 @@
+# core/profiler.py
+
+"""
+스태프 전용 요청 프로파일러
+
+운영 중 특정 페이지(task_detail, profile 등)가 느릴 때, 스태프 사용자가 그 요청 하나만 프로파일링합니다.
+
+- 켜는 법: 요청 헤더 `X-Profile: 1` 또는 쿼리 인자 `?_profile=1`
+- 수집 내용: cProfile 함수별 누적 시간 상위 목록, 실행된 모든 SQL (소요 시간, 호출한 프로젝트 코드 위치)
+- 보고서는 PROFILER_ROOT 에 JSON 파일로 저장되며 최근 PROFILER_MAX_REPORTS 개만 남깁니다.
+- 관리자 페이지 /admin/profiles/ 에서 볼 수 있고, 응답 헤더 X-Profile-Report 에 보고서 ID 가 담깁니다.
+
+플래그가 없는 요청은 헤더/쿼리 문자열 확인 외에 아무 일도 하지 않습니다.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import re
+import time
+import traceback
+import uuid
+from contextlib import ExitStack
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib import admin
+from django.db import connections
+from django.http import Http404
+from django.template.response import TemplateResponse
+
+PROFILER_ROOT = Path(getattr(settings, 'PROFILER_ROOT', Path(settings.BASE_DIR) / 'profiles'))
+PROFILER_MAX_REPORTS = getattr(settings, 'PROFILER_MAX_REPORTS', 100)
+
+HEADER = 'HTTP_X_PROFILE'
+QUERY_PARAM = '_profile'
+TOP_FUNCTIONS = 50
+STACK_DEPTH = 3
+
+REPORT_ID_RE = re.compile(r'^[0-9]{8}-[0-9]{12}-[0-9a-f]{6}$')
+PROJECT_DIR = str(Path(settings.BASE_DIR).resolve())
+THIS_FILE = str(Path(__file__).resolve())
+
+
+def profiling_requested(request):
+    return request.META.get(HEADER) == '1' or request.GET.get(QUERY_PARAM) == '1'
+
+
+def _query_origin():
+    """ 쿼리를 실행한 프로젝트 코드 위치 (가장 안쪽 STACK_DEPTH 개) """
+    frames = [
+        frame for frame in traceback.extract_stack()
+        if frame.filename.startswith(PROJECT_DIR) and 'site-packages' not in frame.filename
+        and frame.filename != THIS_FILE
+    ]
+    return [
+        f'{os.path.relpath(frame.filename, PROJECT_DIR)}:{frame.lineno} in {frame.name}'
+        for frame in frames[-STACK_DEPTH:]
+    ]
+
+
+class QueryRecorder:
+    """ connection.execute_wrapper 로 등록해 실행된 SQL 을 모두 기록합니다. """
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                'alias': self.alias,
+                'sql': sql,
+                'params': None if many else [str(param) for param in params or ()],
+                'many': many,
+                'ms': round((time.perf_counter() - started) * 1000, 3),
+                'origin': _query_origin(),
+            })
+
+
+def _top_functions(profiler):
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, lineno, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({
+            'function': f'{os.path.relpath(filename, PROJECT_DIR) if filename.startswith(PROJECT_DIR) else filename}:{lineno}({name})',
+            'ncalls': ncalls,
+            'tottime_ms': round(tottime * 1000, 3),
+            'cumtime_ms': round(cumtime * 1000, 3),
+        })
+    rows.sort(key=lambda row: row['cumtime_ms'], reverse=True)
+    return rows[:TOP_FUNCTIONS]
+
+
+def save_report(report):
+    """ 보고서를 파일로 저장하고 보존 개수를 넘는 오래된 보고서를 지웁니다. 보고서 ID 를 반환합니다. """
+    PROFILER_ROOT.mkdir(parents=True, exist_ok=True)
+    report_id = f'{datetime.now():%Y%m%d-%H%M%S%f}-{uuid.uuid4().hex[:6]}'
+    (PROFILER_ROOT / f'{report_id}.json').write_text(json.dumps(report, ensure_ascii=False, indent=1))
+
+    # 파일 이름이 시각 순이므로 이름 정렬로 오래된 것부터 지웁니다.
+    paths = sorted(PROFILER_ROOT.glob('*.json'))
+    for old in paths[:max(len(paths) - PROFILER_MAX_REPORTS, 0)]:
+        old.unlink(missing_ok=True)
+    return report_id
+
+
+def load_report(report_id):
+    if not REPORT_ID_RE.match(report_id):
+        raise Http404
+    try:
+        return json.loads((PROFILER_ROOT / f'{report_id}.json').read_text())
+    except FileNotFoundError:
+        raise Http404
+
+
+SUMMARY_FIELDS = ('created_at', 'method', 'path', 'user', 'status', 'total_ms', 'sql_count', 'sql_ms')
+
+
+def list_reports():
+    """ 최신순 보고서 요약 목록 """
+    reports = []
+    for path in sorted(PROFILER_ROOT.glob('*.json'), reverse=True):
+        try:
+            report = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        reports.append({'id': path.stem, **{key: report.get(key) for key in SUMMARY_FIELDS}})
+    return reports
+
+
+class ProfilerMiddleware:
+    """ AuthenticationMiddleware 뒤에 두어야 스태프 여부를 확인할 수 있습니다. """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not profiling_requested(request) or not request.user.is_staff:
+            return self.get_response(request)
+        return self.profile(request)
+
+    def profile(self, request):
+        recorders = [QueryRecorder(alias) for alias in connections]
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for recorder in recorders:
+                stack.enter_context(connections[recorder.alias].execute_wrapper(recorder))
+            try:
+                profiler.enable()
+            except ValueError:
+                # 다른 프로파일러가 이미 동작 중이면 SQL 만 기록합니다.
+                profiler = None
+            try:
+                response = self.get_response(request)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+        total_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        queries = [query for recorder in recorders for query in recorder.queries]
+        report_id = save_report({
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'method': request.method,
+            'path': request.get_full_path(),
+            'user': request.user.get_username(),
+            'status': response.status_code,
+            'total_ms': total_ms,
+            'sql_count': len(queries),
+            'sql_ms': round(sum(query['ms'] for query in queries), 3),
+            'queries': queries,
+            'functions': _top_functions(profiler) if profiler is not None else [],
+        })
+        response['X-Profile-Report'] = report_id
+        return response
+
+
+# -------------------- 관리자 페이지 (config/urls.py 에서 admin_view 로 감싸 연결) --------------------
+
+def report_list_view(request):
+    context = {
+        **admin.site.each_context(request),
+        'title': '요청 프로파일 보고서',
+        'reports': list_reports(),
+        'max_reports': PROFILER_MAX_REPORTS,
+    }
+    return TemplateResponse(request, 'admin/core/profiles/report_list.html', context)
+
+
+def report_detail_view(request, report_id):
+    report = load_report(report_id)
+    context = {
+        **admin.site.each_context(request),
+        'title': f"{report['method']} {report['path']}",
+        'report_id': report_id,
+        'report': report,
+    }
+    return TemplateResponse(request, 'admin/core/profiles/report_detail.html', context)
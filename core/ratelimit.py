@@ -0,0 +1,183 @@
+# core/ratelimit.py
+
+"""
+비싼 엔드포인트용 요청 제한 (rate limiting) 과 부하 차단 (load shedding)
+
+core/urls.py 의 RATE_LIMITS 에 URL 이름별 제한을 적고 apply_limits() 로 urlpatterns 에 적용합니다.
+
+1. 토큰 버킷: 로그인 사용자는 사용자별, 그 외에는 IP 별 버킷을 사용합니다.
+   IP 는 RATELIMIT_TRUSTED_PROXY_COUNT 만큼의 신뢰하는 프록시를 건너뛴 X-Forwarded-For 주소입니다. (client_ip)
+   버킷은 RATELIMIT_CACHE 캐시에 저장되므로 locmem 이면 워커별, Redis/Memcached 등 공유 캐시면 전체 워커 공통입니다.
+   (공유 캐시에서는 읽고-쓰기 사이 경합으로 순간적으로 약간 더 허용될 수 있습니다)
+   버킷이 비면 429 + Retry-After 로 바로 응답합니다.
+2. 동시 실행 상한: expensive=True 인 엔드포인트가 동시에 RATELIMIT_MAX_CONCURRENT 개를 넘으면
+   DB 까지 가지 않고 503 + Retry-After 로 응답합니다.
+   실행 중 개수도 RATELIMIT_CACHE 의 카운터(incr/decr)로 세므로 범위는 버킷과 같습니다. (locmem 이면 워커별)
+   카운터의 만료 시각은 들어오고 나갈 때마다 IN_FLIGHT_TIMEOUT 초 뒤로 미루므로, 요청이 이어지는 동안에는 만료되지 않습니다.
+   워커가 비정상 종료해 남은 개수는 비싼 요청이 IN_FLIGHT_TIMEOUT 초 동안 없으면 카운터와 함께 사라집니다.
+"""
+
+import math
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.urls import URLPattern
+
+RATELIMIT_ENABLED = getattr(settings, 'RATELIMIT_ENABLED', True)
+RATELIMIT_CACHE = getattr(settings, 'RATELIMIT_CACHE', 'default')
+RATELIMIT_MAX_CONCURRENT = getattr(settings, 'RATELIMIT_MAX_CONCURRENT', 8)
+RATELIMIT_TRUSTED_PROXY_COUNT = getattr(settings, 'RATELIMIT_TRUSTED_PROXY_COUNT', 0)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600}
+
+
+class Limit:
+    """
+    rate: '30/m' 처럼 기간당 허용 요청 수 (s, m, h)
+    burst: 버킷 크기 (순간적으로 허용할 요청 수, 기본값은 rate 의 요청 수)
+    when: 이 조건을 만족하는 요청에만 적용 (예: 특정 쿼리 인자가 있을 때)
+    methods: 적용할 HTTP 메서드 (None 이면 전체)
+    expensive: 동시 실행 상한 대상 여부
+    """
+
+    def __init__(self, rate, burst=None, when=None, methods=None, expensive=True):
+        count, period = rate.split('/')
+        self.tokens_per_second = int(count) / PERIODS[period]
+        self.burst = burst or int(count)
+        self.when = when
+        self.methods = methods
+        self.expensive = expensive
+
+    def applies_to(self, request):
+        if self.methods and request.method not in self.methods:
+            return False
+        return self.when is None or self.when(request)
+
+
+def client_ip(request):
+    """ 신뢰하는 프록시가 붙인 주소만 따라가 실제 클라이언트 IP 를 구합니다. """
+    remote_addr = request.META.get('REMOTE_ADDR', '')
+    if not RATELIMIT_TRUSTED_PROXY_COUNT:
+        return remote_addr
+    # 각 프록시는 자신이 받은 연결의 주소를 오른쪽에 덧붙이므로, 왼쪽 값은 클라이언트가 위조할 수 있습니다.
+    forwarded = [addr.strip() for addr in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if addr.strip()]
+    chain = forwarded + [remote_addr]
+    return chain[max(len(chain) - 1 - RATELIMIT_TRUSTED_PROXY_COUNT, 0)]
+
+
+def client_key(request):
+    if request.user.is_authenticated:
+        return f'user:{request.user.pk}'
+    return f'ip:{client_ip(request)}'
+
+
+# -------------------- 1. 토큰 버킷 --------------------
+
+_bucket_lock = threading.Lock()
+
+
+def take_token(name, key, limit, now=None):
+    """ 토큰 하나를 씁니다. 허용되면 0, 아니면 다시 시도할 수 있을 때까지의 초를 반환합니다. """
+    now = time.time() if now is None else now
+    cache = caches[RATELIMIT_CACHE]
+    cache_key = f'ratelimit:{name}:{key}'
+    # 버킷이 가득 차는 데 걸리는 시간만큼만 보관합니다.
+    timeout = math.ceil(limit.burst / limit.tokens_per_second) + 1
+
+    with _bucket_lock:
+        tokens, updated_at = cache.get(cache_key, (limit.burst, now))
+        tokens = min(limit.burst, tokens + (now - updated_at) * limit.tokens_per_second)
+        if tokens < 1:
+            cache.set(cache_key, (tokens, now), timeout)
+            return (1 - tokens) / limit.tokens_per_second
+        cache.set(cache_key, (tokens - 1, now), timeout)
+    return 0
+
+
+def too_many_requests(retry_after):
+    response = HttpResponse('요청이 너무 많습니다. 잠시 후 다시 시도해주세요.', status=429, content_type='text/plain; charset=utf-8')
+    response['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+# -------------------- 2. 동시 실행 상한 --------------------
+
+IN_FLIGHT_KEY = 'ratelimit:in_flight'
+IN_FLIGHT_TIMEOUT = 60
+
+
+def _enter_expensive():
+    cache = caches[RATELIMIT_CACHE]
+    cache.add(IN_FLIGHT_KEY, 0, IN_FLIGHT_TIMEOUT)
+    try:
+        in_flight = cache.incr(IN_FLIGHT_KEY)
+    except ValueError:
+        # add 와 incr 사이에 만료된 경우
+        cache.add(IN_FLIGHT_KEY, 1, IN_FLIGHT_TIMEOUT)
+        in_flight = 1
+    if in_flight < 1:
+        # 만료 뒤 새로 만든 카운터를 이전 요청들이 decr 해 음수가 된 경우
+        cache.set(IN_FLIGHT_KEY, 1, IN_FLIGHT_TIMEOUT)
+        in_flight = 1
+    # incr 는 만료 시각을 바꾸지 않으므로 직접 연장합니다.
+    cache.touch(IN_FLIGHT_KEY, IN_FLIGHT_TIMEOUT)
+    if in_flight > RATELIMIT_MAX_CONCURRENT:
+        _leave_expensive()
+        return False
+    return True
+
+
+def _leave_expensive():
+    cache = caches[RATELIMIT_CACHE]
+    try:
+        cache.decr(IN_FLIGHT_KEY)
+    except ValueError:
+        return  # 카운터가 이미 만료됨
+    cache.touch(IN_FLIGHT_KEY, IN_FLIGHT_TIMEOUT)
+
+
+def service_unavailable():
+    response = HttpResponse('요청이 몰려 잠시 처리할 수 없습니다. 잠시 후 다시 시도해주세요.', status=503, content_type='text/plain; charset=utf-8')
+    response['Retry-After'] = '1'
+    return response
+
+
+# -------------------- urlpatterns 에 적용 --------------------
+
+def limit_view(view, name, limit):
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        if not RATELIMIT_ENABLED or not limit.applies_to(request):
+            return view(request, *args, **kwargs)
+
+        retry_after = take_token(name, client_key(request), limit)
+        if retry_after:
+            return too_many_requests(retry_after)
+
+        if not limit.expensive:
+            return view(request, *args, **kwargs)
+        if not _enter_expensive():
+            return service_unavailable()
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            _leave_expensive()
+
+    return wrapped
+
+
+def apply_limits(urlpatterns, limits):
+    """ RATE_LIMITS 에 이름이 있는 URL 의 뷰를 제한 뷰로 감싼 새 목록을 반환합니다. """
+    unknown = set(limits) - {pattern.name for pattern in urlpatterns if isinstance(pattern, URLPattern)}
+    if unknown:
+        raise ValueError(f'RATE_LIMITS 에 없는 URL 이름이 있습니다: {sorted(unknown)}')
+    return [
+        URLPattern(pattern.pattern, limit_view(pattern.callback, pattern.name, limits[pattern.name]),
+                   pattern.default_args, pattern.name)
+        if isinstance(pattern, URLPattern) and pattern.name in limits else pattern
+        for pattern in urlpatterns
+    ]
@@ -0,0 +1,115 @@
+# core/rollups.py
+
+"""
+운영 통계 롤업 (시간별 / 일별)
+
+rollup_stats 관리 명령이 주기적으로 호출합니다.
+집계 단위마다 워터마크(마지막으로 반영한 시각)를 저장해 두고, 워터마크가 속한 구간부터
+현재 시각까지만 원본 테이블을 다시 집계해 StatsRollup 행을 교체합니다.
+원본 쿼리는 created_at / closed_at 인덱스 범위만 읽으므로 비용이 전체 테이블 크기와 무관합니다.
+"""
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, DateTimeField, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+from .models import Task, TaskReview, StatsRollup, RollupWatermark, ArchivedTask
+
+GRANULARITIES = [value for value, _ in StatsRollup.GRANULARITY_CHOICES]
+
+# 진행 중이던 트랜잭션이 워터마크보다 이른 시각으로 커밋될 수 있으므로 이만큼 되돌아가 다시 집계합니다.
+DEFAULT_LAG = timedelta(minutes=5)
+
+METRIC_FIELDS = ('tasks_created', 'tasks_completed', 'tasks_expired', 'points_paid', 'rating_sum', 'rating_count')
+
+
+def bucket_floor(value, granularity):
+    """ 현지 시간 기준으로 구간 시작 시각을 구합니다. """
+    value = timezone.localtime(value).replace(minute=0, second=0, microsecond=0)
+    if granularity == 'day':
+        value = value.replace(hour=0)
+    return value
+
+
+def _grouped(queryset, field, granularity, start, end, **aggregates):
+    """ [start, end) 구간의 행을 구간 단위로 묶어 {구간 시작: 집계값} 으로 반환합니다. """
+    rows = (
+        queryset
+        .filter(**{f'{field}__gte': start, f'{field}__lt': end})
+        .annotate(bucket=Trunc(field, granularity, output_field=DateTimeField()))
+        .values('bucket')
+        .annotate(**aggregates)
+        .order_by()
+    )
+    return {row.pop('bucket'): row for row in rows}
+
+
+def compute_buckets(granularity, start, end):
+    """ [start, end) 구간의 통계를 원본 테이블에서 다시 계산합니다. """
+    buckets = {}
+
+    def merge(grouped):
+        for bucket, values in grouped.items():
+            metrics = buckets.setdefault(bucket, dict.fromkeys(METRIC_FIELDS, 0))
+            for name, value in values.items():
+                metrics[name] += value or 0
+
+    # 보관 테이블로 옮겨진 심부름도 함께 집계해야 --rebuild 결과가 달라지지 않습니다.
+    for model in (Task, ArchivedTask):
+        merge(_grouped(model.objects.all(), 'created_at', granularity, start, end, tasks_created=Count('id')))
+        merge(_grouped(
+            model.objects.filter(status='completed'), 'closed_at', granularity, start, end,
+            tasks_completed=Count('id'), points_paid=Sum('reward_points'),
+        ))
+        merge(_grouped(model.objects.filter(status='expired'), 'closed_at', granularity, start, end, tasks_expired=Count('id')))
+    merge(_grouped(
+        TaskReview.objects.all(), 'created_at', granularity, start, end,
+        rating_sum=Sum('rating'), rating_count=Count('id'),
+    ))
+    return buckets
+
+
+def _earliest_event():
+    candidates = [
+        Task.objects.order_by('created_at').values_list('created_at', flat=True).first(),
+        ArchivedTask.objects.order_by('created_at').values_list('created_at', flat=True).first(),
+        TaskReview.objects.order_by('created_at').values_list('created_at', flat=True).first(),
+    ]
+    candidates = [value for value in candidates if value is not None]
+    return min(candidates) if candidates else None
+
+
+def run_rollup(granularity, now=None, lag=DEFAULT_LAG):
+    """
+    한 집계 단위의 롤업을 워터마크부터 현재까지 갱신합니다.
+    반환값: 다시 계산한 구간 수
+    """
+    now = now or timezone.now()
+    watermark = RollupWatermark.objects.filter(name=granularity).first()
+    since = watermark.value - lag if watermark else _earliest_event()
+    if since is None:
+        return 0
+
+    start = bucket_floor(since, granularity)
+    buckets = compute_buckets(granularity, start, now)
+
+    with transaction.atomic():
+        # 다시 계산한 구간은 통째로 교체합니다. (멱등)
+        StatsRollup.objects.filter(granularity=granularity, bucket_start__gte=start).delete()
+        StatsRollup.objects.bulk_create([
+            StatsRollup(granularity=granularity, bucket_start=bucket, **metrics)
+            for bucket, metrics in sorted(buckets.items())
+        ])
+        RollupWatermark.objects.update_or_create(name=granularity, defaults={'value': now})
+    return len(buckets)
+
+
+def run_rollups(now=None, lag=DEFAULT_LAG, rebuild=False):
+    """ 모든 집계 단위의 롤업을 갱신하고 {집계 단위: 갱신 구간 수} 를 반환합니다. """
+    now = now or timezone.now()
+    if rebuild:
+        RollupWatermark.objects.filter(name__in=GRANULARITIES).delete()
+    return {granularity: run_rollup(granularity, now=now, lag=lag) for granularity in GRANULARITIES}
@@ -0,0 +1,63 @@
+# core/signals.py
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import leaderboard, snapshots
+from .models import UserProfile, Task, TaskReview
+
+User = get_user_model()
+
+# -------------------- 회원가입 및 프로필 생성 자동화 --------------------
+# CoreConfig.ready() 에서 임포트되므로 URLconf 로딩 여부와 관계없이 항상 연결됩니다.
+
+@receiver(post_save, sender=User)
+def create_user_profile(sender, instance, created, **kwargs):
+    if created:
+        UserProfile.objects.create(user=instance)
+
+
+# -------------------- 받은 리뷰 요약 (UserProfile / 리더보드) --------------------
+# 뷰뿐 아니라 관리자 페이지, ORM, 사용자 삭제에 따른 CASCADE 로 바뀌는 리뷰도 요약 컬럼에 반영합니다.
+# (QuerySet.update() 로 별점/대상자를 바꾸면 시그널이 없으므로 요약이 어긋납니다)
+
+def _record_review(user_id, rating, written_at, count):
+    UserProfile.record_review(user_id, rating, count)
+    leaderboard.record_review(user_id, rating, written_at, count)
+
+
+@receiver(pre_save, sender=TaskReview)
+def remember_previous_review(sender, instance, **kwargs):
+    instance._previous_review = None
+    if not instance._state.adding:
+        instance._previous_review = (
+            TaskReview.objects.filter(pk=instance.pk).values('reviewed_user_id', 'rating', 'created_at').first()
+        )
+
+
+@receiver(post_save, sender=TaskReview)
+def update_review_summary(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_review', None)
+    if not created:
+        if previous is None or (previous['reviewed_user_id'], previous['rating']) == (instance.reviewed_user_id, instance.rating):
+            return
+        _record_review(previous['reviewed_user_id'], previous['rating'], previous['created_at'], -1)
+    _record_review(instance.reviewed_user_id, instance.rating, instance.created_at, 1)
+
+
+@receiver(post_delete, sender=TaskReview)
+def remove_review_summary(sender, instance, **kwargs):
+    _record_review(instance.reviewed_user_id, instance.rating, instance.created_at, -1)
+
+
+# -------------------- 공개 피드 스냅샷 갱신 --------------------
+# 리뷰는 최소 별점 필터 결과를 바꾸므로 함께 감시합니다.
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=TaskReview)
+def schedule_feed_snapshot(sender, **kwargs):
+    if snapshots.FEED_SNAPSHOTS_ENABLED:
+        transaction.on_commit(snapshots.schedule_publish)
@@ -0,0 +1,189 @@
+# core/snapshots.py
+
+"""
+공개 심부름 피드 스냅샷
+
+로그인하지 않은 방문자는 모두 같은 심부름 목록을 보므로, 성별 × 최소 별점 필터 조합마다
+앞쪽 몇 페이지를 HTML/JSON 파일로 미리 렌더링해 FEED_SNAPSHOT_ROOT 에 저장합니다.
+
+    <FEED_SNAPSHOT_ROOT>/feed/<성별 A|M|F>/<최소 별점 0~5>/<페이지>.html
+    <FEED_SNAPSHOT_ROOT>/feed/<성별 A|M|F>/<최소 별점 0~5>/<페이지>.json
+
+파일은 임시 파일에 쓴 뒤 os.replace 로 바꾸므로 읽는 쪽이 반쯤 쓰인 파일을 볼 일이 없습니다.
+발행은 FEED_SNAPSHOT_ROOT/.publish.lock 파일 잠금 안에서 DB 를 읽고 파일을 쓰므로, 여러 워커가 동시에 발행해도
+먼저 읽은(오래된) 목록이 나중에 읽은 목록을 덮어쓰지 않습니다.
+앞단 웹 서버가 세션 쿠키가 없는 요청에 이 파일을 바로 내려주면 파이썬 코드가 전혀 실행되지 않습니다.
+(예: nginx 에서 쿼리 인자 gender/min_rating/page 를 경로로 바꿔 try_files 후 Django 로 넘김)
+task_list 뷰도 로그인하지 않은 요청에는 같은 파일을 읽어 응답합니다.
+
+스냅샷 갱신
+- 심부름/리뷰가 바뀌면 커밋 후 FEED_SNAPSHOT_DEBOUNCE_SECONDS 뒤에 한 번 다시 발행합니다. (그 사이 변경은 합쳐짐)
+- 주기 실행: python manage.py publish_feed
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.files import locks
+from django.db import connections
+from django.http import HttpRequest, QueryDict
+from django.template.loader import render_to_string
+
+logger = logging.getLogger(__name__)
+
+FEED_SNAPSHOTS_ENABLED = getattr(settings, 'FEED_SNAPSHOTS_ENABLED', False)
+FEED_SNAPSHOT_ROOT = Path(getattr(settings, 'FEED_SNAPSHOT_ROOT', Path(settings.BASE_DIR) / 'feed_snapshots'))
+FEED_SNAPSHOT_PAGES = getattr(settings, 'FEED_SNAPSHOT_PAGES', 3)
+FEED_SNAPSHOT_DEBOUNCE_SECONDS = getattr(settings, 'FEED_SNAPSHOT_DEBOUNCE_SECONDS', 5)
+
+GENDERS = ('A', 'M', 'F')
+MIN_RATINGS = range(0, 6)  # 0 은 별점 조건 없음
+
+
+def snapshot_path(gender, min_rating, page, extension='html'):
+    return FEED_SNAPSHOT_ROOT / 'feed' / gender / str(min_rating) / f'{page}.{extension}'
+
+
+def snapshot_for_request(params):
+    """ 요청 쿼리에 해당하는 HTML 스냅샷 내용을 반환합니다. 없거나 대상이 아니면 None. """
+    if not FEED_SNAPSHOTS_ENABLED:
+        return None
+
+    gender = params.get('gender') or 'A'
+    min_rating = params.get('min_rating') or '0'
+    page = params.get('page') or '1'
+    if gender not in GENDERS or not min_rating.isdigit() or not page.isdigit():
+        return None
+    if int(min_rating) not in MIN_RATINGS or not 1 <= int(page) <= FEED_SNAPSHOT_PAGES:
+        return None
+
+    try:
+        return snapshot_path(gender, int(min_rating), int(page)).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _write_atomic(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(content)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+@contextmanager
+def _publish_lock_file():
+    """ 워커/프로세스 사이에서 발행을 한 번에 하나씩만 실행합니다. """
+    FEED_SNAPSHOT_ROOT.mkdir(parents=True, exist_ok=True)
+    with open(FEED_SNAPSHOT_ROOT / '.publish.lock', 'wb') as lock_file:
+        locks.lock(lock_file, locks.LOCK_EX)
+        try:
+            yield
+        finally:
+            locks.unlock(lock_file)
+
+
+def _anonymous_request(params):
+    request = HttpRequest()
+    request.method = 'GET'
+    request.path = request.path_info = '/'
+    request.GET = params
+    request.META = {'SERVER_NAME': 'localhost', 'SERVER_PORT': '80'}
+    request.user = AnonymousUser()
+    return request
+
+
+def _feed_json(context):
+    page_obj = context['page_obj']
+    return {
+        'page': page_obj.number,
+        'num_pages': page_obj.paginator.num_pages,
+        'count': page_obj.paginator.count,
+        'gender': context['current_gender'],
+        'min_rating': context['current_min_rating'] or 0,
+        'tasks': [
+            {
+                'id': task.pk,
+                'title': task.title,
+                'content': task.content,
+                'reward_points': task.reward_points,
+                'location': task.location,
+                'due_date': task.due_date.isoformat(),
+                'created_at': task.created_at.isoformat(),
+                'registrant': task.registrant.username,
+            }
+            for task in context['tasks']
+        ],
+    }
+
+
+def publish_feed_snapshots():
+    """ 모든 필터 조합의 앞쪽 페이지 스냅샷을 다시 씁니다. 반환값: 쓴 페이지 수 """
+    from .views import task_feed_context  # views 가 이 모듈을 임포트하므로 지연 임포트
+
+    written = 0
+    # 잠금을 얻은 뒤에 DB 를 읽어야, 나중에 쓰는 쪽이 항상 더 최신 목록을 씁니다.
+    with _publish_lock_file():
+        for gender in GENDERS:
+            for min_rating in MIN_RATINGS:
+                for page in range(1, FEED_SNAPSHOT_PAGES + 1):
+                    params = QueryDict(mutable=True)
+                    params.update({'gender': gender, 'min_rating': str(min_rating), 'page': str(page)})
+                    context = task_feed_context(AnonymousUser(), params)
+
+                    html_path = snapshot_path(gender, min_rating, page)
+                    json_path = snapshot_path(gender, min_rating, page, 'json')
+                    if page > 1 and page > context['page_obj'].paginator.num_pages:
+                        # 없어진 페이지의 이전 스냅샷은 지워 Django 뷰가 직접 처리하도록 합니다.
+                        html_path.unlink(missing_ok=True)
+                        json_path.unlink(missing_ok=True)
+                        continue
+
+                    html = render_to_string('core/task_list.html', context, request=_anonymous_request(params))
+                    _write_atomic(html_path, html.encode())
+                    _write_atomic(json_path, json.dumps(_feed_json(context), ensure_ascii=False).encode())
+                    written += 1
+    return written
+
+
+# -------------------- 변경 감지 후 지연 발행 (debounce) --------------------
+
+_publish_timer = None
+_publish_lock = threading.Lock()
+
+
+def _run_scheduled_publish():
+    global _publish_timer
+    with _publish_lock:
+        _publish_timer = None
+    try:
+        publish_feed_snapshots()
+    except Exception:
+        logger.exception('공개 피드 스냅샷 발행 실패')
+    finally:
+        connections.close_all()
+
+
+def schedule_publish():
+    """ 잠시 뒤 스냅샷을 다시 발행합니다. 이미 예약되어 있으면 그 발행에 합쳐집니다. """
+    global _publish_timer
+    if not FEED_SNAPSHOTS_ENABLED:
+        return
+    with _publish_lock:
+        if _publish_timer is not None:
+            return
+        _publish_timer = threading.Timer(FEED_SNAPSHOT_DEBOUNCE_SECONDS, _run_scheduled_publish)
+        _publish_timer.daemon = True
+        _publish_timer.start()
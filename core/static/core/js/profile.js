@@ -0,0 +1,15 @@
+// 프로필: 받은 리뷰 '더 보기' 버튼을 다음 페이지 조각으로 교체합니다.
+(function () {
+    const container = document.getElementById('received-reviews');
+    if (!container) return;
+
+    container.addEventListener('click', function (event) {
+        const button = event.target.closest('.js-more-reviews');
+        if (!button) return;
+        button.disabled = true;
+        fetch(button.dataset.url, {credentials: 'same-origin'})
+            .then(function (response) { return response.text(); })
+            .then(function (html) { button.outerHTML = html; })
+            .catch(function () { button.disabled = false; });
+    });
+})();
@@ -0,0 +1,153 @@
+# core/static_assets.py
+
+"""
+운영용 정적 파일 파이프라인
+
+1. CompressedManifestStaticFilesStorage
+   collectstatic 시 파일 이름에 내용 해시를 붙이고(ManifestStaticFilesStorage),
+   압축 효과가 있는 파일마다 .gz (와 brotli 패키지가 있으면 .br) 변형을 미리 만들어 둡니다.
+2. StaticFilesMiddleware
+   STATIC_URL 요청을 세션/인증 미들웨어 전에 STATIC_ROOT 에서 바로 응답합니다.
+   - 해시가 붙은 파일: Cache-Control: public, max-age=1년, immutable (다시 확인 요청 없음)
+   - 그 외 파일: 매번 재검증 (Last-Modified / 304)
+   - Accept-Encoding 에 따라 .br → .gz → 원본 순으로 고릅니다.
+
+settings 에서 DJANGO_STATIC_PROFILE=production 일 때만 사용합니다.
+앞단 웹 서버(nginx 등)가 있다면 같은 규칙(gzip_static, expires max)으로 STATIC_ROOT 를 직접 서빙해도 됩니다.
+"""
+
+import gzip
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+try:
+    import brotli
+except ImportError:  # brotli 는 선택 사항입니다. 없으면 gzip 변형만 만듭니다.
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.mjs', '.map', '.svg', '.json', '.txt', '.html', '.xml', '.ico')
+# 압축 결과가 원본의 이 비율보다 작을 때만 변형을 남깁니다.
+MIN_COMPRESSION_RATIO = 0.95
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+# 파일이름.<12자리 해시>.확장자
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}\.[^./]+$')
+
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def compress_file(path):
+    """ path 옆에 .gz / .br 변형을 만들고, 만든 확장자 목록을 반환합니다. """
+    with open(path, 'rb') as source:
+        content = source.read()
+
+    variants = {'.gz': gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(content)
+
+    written = []
+    for extension, compressed in variants.items():
+        if len(compressed) >= len(content) * MIN_COMPRESSION_RATIO:
+            continue
+        with open(path + extension, 'wb') as target:
+            target.write(compressed)
+        written.append(extension)
+    return written
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """ 해시 이름 + 미리 압축한 변형을 함께 만드는 collectstatic 저장소 """
+
+    def post_process(self, paths, dry_run=False, **options):
+        processed_names = set()
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            if hashed_name and not isinstance(processed, Exception):
+                processed_names.update((name, hashed_name))
+            yield name, hashed_name, processed
+
+        if dry_run:
+            return
+        for name in sorted(processed_names):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS) and self.exists(name):
+                compress_file(self.path(name))
+
+
+# -------------------- 서빙 --------------------
+
+def accepted_encodings(request):
+    header = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.partition(';')
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                if float(params[2:]) == 0:
+                    continue  # q=0 은 명시적인 거부
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class StaticFilesMiddleware:
+    """ SecurityMiddleware 바로 뒤에 두어 정적 파일 요청이 나머지 미들웨어를 거치지 않게 합니다. """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = '/' + settings.STATIC_URL.lstrip('/')
+        self.root = str(settings.STATIC_ROOT)
+
+    def __call__(self, request):
+        if not request.path_info.startswith(self.prefix):
+            return self.get_response(request)
+        if request.method not in ('GET', 'HEAD'):
+            return HttpResponse(status=405, headers={'Allow': 'GET, HEAD'})
+        try:
+            return self.serve(request, request.path_info[len(self.prefix):])
+        except Http404:
+            return HttpResponse(status=404)
+
+    def serve(self, request, name):
+        try:
+            path = safe_join(self.root, name)
+        except SuspiciousFileOperation:
+            raise Http404
+        if not os.path.isfile(path):
+            raise Http404
+
+        stat = os.stat(path)
+        immutable = bool(HASHED_NAME_RE.search(name))
+        if not immutable and not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), stat.st_mtime):
+            return HttpResponseNotModified()
+
+        content_type, _ = mimetypes.guess_type(path)
+        served_path, content_encoding = path, None
+        accepted = accepted_encodings(request)
+        for encoding, extension in ENCODINGS:
+            if encoding in accepted and os.path.isfile(path + extension):
+                served_path, content_encoding = path + extension, encoding
+                break
+
+        response = FileResponse(open(served_path, 'rb'), content_type=content_type or 'application/octet-stream')
+        # FileResponse 가 붙이는 inline 파일 이름(.gz/.br)은 정적 파일에 필요 없습니다.
+        response.headers.pop('Content-Disposition', None)
+        if content_encoding:
+            response['Content-Encoding'] = content_encoding
+        if name.endswith(COMPRESSIBLE_EXTENSIONS):
+            response['Vary'] = 'Accept-Encoding'
+        response['Last-Modified'] = http_date(stat.st_mtime)
+        response['Cache-Control'] = (
+            f'public, max-age={IMMUTABLE_MAX_AGE}, immutable' if immutable else 'public, max-age=0, must-revalidate'
+        )
+        return response
+
@@ -1,3 +1,946 @@
-from django.test import TestCase
+import re
+import runpy
+import shutil
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.db import connection, connections
+from django.db.models.signals import post_save
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from . import db_maintenance, db_router, leaderboard, profiler, ratelimit, rollups, snapshots, warmup
+from .static_assets import StaticFilesMiddleware, compress_file
+from .admin import EstimatedCountPaginator
+from .archive import archive_tasks
+from .models import ArchivedTask, LeaderboardEntry, StatsRollup, Task, TaskApplication, TaskReview, UserProfile
+
+User = get_user_model()
+
+
+# -------------------- 관리자 페이지 (대용량 테이블) --------------------
+
+class AdminChangelistQueryCountTests(TestCase):
+    """ 각 changelist 의 쿼리 수가 행 수와 무관하게 일정한지 확인합니다. """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser('admin')
+
+    def setUp(self):
+        self.client.force_login(self.admin_user)
+
+    def add_rows(self, count):
+        start = User.objects.count()
+        for i in range(start, start + count):
+            registrant = User.objects.create_user(f'registrant{i}')
+            helper = User.objects.create_user(f'helper{i}')
+            task = Task.objects.create(
+                title=f'심부름 {i}', content='내용', reward_points=10, location='교내',
+                due_date=timezone.now() + timedelta(days=1),
+                registrant=registrant, assigned_to=helper, status='completed',
+            )
+            TaskApplication.objects.create(task=task, applicant=helper)
+            TaskReview.objects.create(task=task, reviewer=registrant, reviewed_user=helper, rating=5)
+
+            # 보관 테이블로 옮겨질 오래된 완료 심부름과 그 리뷰 (리뷰의 __str__ 가 archived_task 를 사용)
+            old_task = Task.objects.create(
+                title=f'지난 심부름 {i}', content='내용', reward_points=10, location='교내',
+                due_date=timezone.now() - timedelta(days=200),
+                registrant=registrant, assigned_to=helper, status='completed',
+            )
+            Task.objects.filter(pk=old_task.pk).update(closed_at=timezone.now() - timedelta(days=200))
+            TaskReview.objects.create(task=old_task, reviewer=registrant, reviewed_user=helper, rating=4)
+        archive_tasks(retention_days=90)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context)
+
+    def assertConstantQueries(self, model_name, max_queries=12):
+        url = reverse(f'admin:core_{model_name}_changelist')
+        self.add_rows(2)
+        small = self.count_queries(url)
+        self.add_rows(8)
+        large = self.count_queries(url)
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, max_queries)
+
+    def test_task_changelist(self):
+        self.assertConstantQueries('task')
+
+    def test_taskapplication_changelist(self):
+        self.assertConstantQueries('taskapplication')
+
+    def test_userprofile_changelist(self):
+        self.assertConstantQueries('userprofile')
+
+    def test_taskreview_changelist(self):
+        self.assertConstantQueries('taskreview')
+        self.assertTrue(TaskReview.objects.filter(task=None, archived_task__isnull=False).exists())
+
+    def test_taskreview_form_does_not_list_archived_tasks(self):
+        self.add_rows(2)
+        response = self.client.get(reverse('admin:core_taskreview_add'))
+        self.assertNotContains(response, '지난 심부름')
+
+
+class MyTasksDashboardTests(TestCase):
+
+    def add_rows(self, user, count):
+        start = User.objects.count()
+        for i in range(start, start + count):
+            other = User.objects.create_user(f'other{i}')
+            due_date = timezone.now() + timedelta(days=1)
+            mine = Task.objects.create(title=f'등록 {i}', content='내용', reward_points=10, location='교내',
+                                       due_date=due_date, registrant=user, assigned_to=other, status='completed')
+            TaskApplication.objects.create(task=mine, applicant=other)
+            TaskReview.objects.create(task=mine, reviewer=user, reviewed_user=other, rating=4)
+            theirs = Task.objects.create(title=f'수행 {i}', content='내용', reward_points=10, location='교내',
+                                         due_date=due_date, registrant=other, assigned_to=user, status='assigned')
+            TaskApplication.objects.create(task=theirs, applicant=user)
+
+    def test_query_count_does_not_grow_with_tasks(self):
+        user = User.objects.create_user('me')
+        self.client.force_login(user)
+
+        self.add_rows(user, 1)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(reverse('my_tasks'))
+        self.add_rows(user, 5)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(reverse('my_tasks'))
+
+        self.assertEqual(len(small), len(large))
+        self.assertEqual(response.context['counts']['registered'], 6)
+        self.assertEqual(response.context['counts']['applied'], 6)
+        # 공개 피드에는 모집 중인 심부름만 보입니다.
+        self.assertNotContains(self.client.get(reverse('home')), '등록 1')
+
+
+class AdminBulkActionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser('admin')
+        cls.registrant = User.objects.create_user('registrant')
+        cls.helper = User.objects.create_user('helper')
+
+    def setUp(self):
+        self.client.force_login(self.admin_user)
+
+    def create_task(self, **kwargs):
+        defaults = {
+            'title': '심부름', 'content': '내용', 'reward_points': 10, 'location': '교내',
+            'due_date': timezone.now() + timedelta(days=1), 'registrant': self.registrant,
+        }
+        defaults.update(kwargs)
+        return Task.objects.create(**defaults)
+
+    def run_action(self, model_name, action, objects, **extra):
+        data = {'action': action, '_selected_action': [obj.pk for obj in objects], **extra}
+        return self.client.post(reverse(f'admin:core_{model_name}_changelist'), data)
+
+    def test_expire_tasks_skips_completed(self):
+        open_task = self.create_task()
+        done_task = self.create_task(status='completed', assigned_to=self.helper)
+        self.run_action('task', 'expire_tasks', [open_task, done_task])
+
+        open_task.refresh_from_db()
+        done_task.refresh_from_db()
+        self.assertEqual(open_task.status, 'expired')
+        self.assertIsNotNone(open_task.closed_at)
+        self.assertEqual(done_task.status, 'completed')
+
+    def test_reassign_tasks(self):
+        task = self.create_task()
+        self.run_action('task', 'reassign_tasks', [task], assignee='helper')
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.assigned_to), ('assigned', self.helper))
+
+        self.run_action('task', 'reassign_tasks', [task], assignee='')
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.assigned_to), ('open', None))
+
+    def test_recompute_stats(self):
+        self.create_task(status='completed', assigned_to=self.helper)
+        self.create_task(status='completed', assigned_to=self.helper)
+        TaskReview.objects.create(reviewer=self.registrant, reviewed_user=self.helper, rating=4)
+        TaskReview.objects.create(reviewer=self.admin_user, reviewed_user=self.helper, rating=5)
+        profile = UserProfile.objects.get(user=self.helper)
+        self.run_action('userprofile', 'recompute_stats', [profile])
+        profile.refresh_from_db()
+        self.assertEqual(profile.tasks_completed, 2)
+        self.assertEqual((profile.review_count, profile.rating_sum, profile.rating_4_count), (2, 9, 1))
+
+
+class EstimatedCountPaginatorTests(TestCase):
+
+    def test_filtered_count_is_capped(self):
+        for i in range(5):
+            User.objects.create_user(f'user{i}')
+        paginator = EstimatedCountPaginator(UserProfile.objects.filter(points=0).order_by('pk'), 2)
+        paginator.MAX_EXACT_COUNT = 3
+        self.assertEqual(paginator.count, 3)
+
+
+# -------------------- 완료/마감 심부름 보관 --------------------
+
+class ArchiveTasksTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.registrant = User.objects.create_user('registrant')
+        cls.helper = User.objects.create_user('helper')
+
+    def create_task(self, closed_days_ago, **kwargs):
+        task = Task.objects.create(
+            title='심부름', content='내용', reward_points=10, location='교내',
+            due_date=timezone.now(), registrant=self.registrant, assigned_to=self.helper, **kwargs
+        )
+        if closed_days_ago is not None:
+            Task.objects.filter(pk=task.pk).update(closed_at=timezone.now() - timedelta(days=closed_days_ago))
+        return task
+
+    def test_old_closed_tasks_are_moved_with_applications_and_reviews(self):
+        old = self.create_task(100, status='completed')
+        recent = self.create_task(1, status='completed')
+        still_open = self.create_task(None)
+        TaskApplication.objects.create(task=old, applicant=self.helper, status='accepted')
+        review = TaskReview.objects.create(task=old, reviewer=self.registrant, reviewed_user=self.helper, rating=4)
+
+        self.assertEqual(archive_tasks(retention_days=90, batch_size=1), 1)
+
+        self.assertEqual(set(Task.objects.values_list('pk', flat=True)), {recent.pk, still_open.pk})
+        archived = ArchivedTask.objects.get(pk=old.pk)
+        self.assertEqual(archived.applications.get().applicant, self.helper)
+        review.refresh_from_db()
+        self.assertEqual((review.task, review.archived_task), (None, archived))
+
+        # 상세 페이지는 같은 주소로 보관된 심부름을 보여줍니다.
+        response = self.client.get(reverse('task_detail', args=[old.pk]))
+        self.assertContains(response, '보관됨')
+
+
+
+# -------------------- 프로필 받은 리뷰 --------------------
+
+class ProfileReviewsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.helper = User.objects.create_user('helper')
+        reviewers = [User.objects.create_user(f'reviewer{i}') for i in range(3)]
+        for i in range(25):
+            TaskReview.objects.create(reviewer=reviewers[i % 3], reviewed_user=cls.helper, rating=i % 5 + 1, comment=f'리뷰 {i}')
+
+    def setUp(self):
+        self.client.force_login(self.helper)
+
+    def test_profile_renders_summary_and_first_page(self):
+        response = self.client.get(reverse('profile'))
+        self.assertEqual(response.context['review_count'], 25)
+        self.assertEqual(response.context['average_rating'], 3.0)
+        self.assertEqual(response.context['rating_histogram'][0], (5, 5, 20))
+        self.assertEqual(len(response.context['received_reviews']), 10)
+        self.assertIsNotNone(response.context['next_cursor'])
+
+    def test_keyset_pages_cover_all_reviews_once(self):
+        seen = [review.pk for review in self.client.get(reverse('profile')).context['received_reviews']]
+        cursor = self.client.get(reverse('profile')).context['next_cursor']
+        while cursor:
+            response = self.client.get(reverse('profile_reviews'), {'cursor': cursor})
+            seen += [review.pk for review in response.context['received_reviews']]
+            cursor = response.context['next_cursor']
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(len(set(seen)), 25)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('profile_reviews'), {'cursor': 'abc'})
+        self.assertEqual(response.status_code, 400)
+
+
+# -------------------- 읽기 복제본 라우팅 --------------------
+
+class ReplicaRoutingTests(TestCase):
+
+    def test_write_request_pins_following_reads_to_primary(self):
+        seen = []
+
+        def view(request):
+            seen.append(db_router._replica_allowed.get())
+            return HttpResponse()
+
+        middleware = db_router.ReplicaRoutingMiddleware(view)
+        factory = RequestFactory()
+
+        middleware(factory.get('/'))
+        response = middleware(factory.post('/'))
+        pinned_request = factory.get('/')
+        pinned_request.COOKIES[db_router.PIN_COOKIE_NAME] = response.cookies[db_router.PIN_COOKIE_NAME].value
+        middleware(pinned_request)
+
+        self.assertEqual(seen, [True, False, False])
+
+    @mock.patch.object(db_router, 'replica_configured', return_value=True)
+    def test_reads_inside_atomic_block_stay_on_primary(self, _):
+        router = db_router.PrimaryReplicaRouter()
+        with db_router.replica_reads():
+            self.assertEqual(db_router.read_alias(), 'replica')
+            # TestCase 자체가 트랜잭션 안에서 실행됩니다.
+            self.assertEqual(router.db_for_read(Task), 'default')
+            self.assertEqual(router.db_for_write(Task), 'default')
+
+
+class ReplicaStaleUserTests(TransactionTestCase):
+    """ 고정 시간이 지난 뒤, 복제본 동기화 이후 가입한 사용자의 요청 """
+
+    @mock.patch.object(db_router, 'replica_configured', return_value=True)
+    def test_user_and_own_profile_are_read_from_primary(self, _):
+        user = User.objects.create_user('newcomer')
+        router = db_router.PrimaryReplicaRouter()
+        request = RequestFactory().get('/')
+        request.COOKIES[db_router.PIN_COOKIE_NAME] = str(time.time() - 1)  # 만료된 고정
+
+        def view(request):
+            self.assertEqual(router.db_for_read(Task), 'replica')
+            # 복제본 별칭은 실제로 없으므로 복제본으로 가면 ConnectionDoesNotExist 가 납니다.
+            loaded = User.objects.get(pk=user.pk)
+            self.assertEqual(loaded._state.db, 'default')
+            self.assertEqual(loaded.userprofile.pk, user.pk)
+            return HttpResponse()
+
+        db_router.ReplicaRoutingMiddleware(view)(request)
+
+    @mock.patch.object(db_router, 'replica_configured', return_value=True)
+    def test_apply_then_task_detail_reads_from_primary(self, _):
+        registrant, helper = User.objects.create_user('registrant'), User.objects.create_user('helper')
+        task = Task.objects.create(
+            title='지원 심부름', content='내용', reward_points=10, location='정문',
+            due_date=timezone.now() + timedelta(days=1), registrant=registrant,
+        )
+        self.client.force_login(helper)
+        # 지원은 상태를 바꾸므로 GET 으로는 받지 않습니다.
+        self.assertEqual(self.client.get(reverse('task_apply', args=[task.pk])).status_code, 405)
+
+        # 복제본 별칭은 실제로 없으므로, 상세 페이지가 복제본에서 읽으면 ConnectionDoesNotExist 가 납니다.
+        response = self.client.post(reverse('task_apply', args=[task.pk]), follow=True)
+        self.assertIn(db_router.PIN_COOKIE_NAME, self.client.cookies)
+        self.assertContains(response, '이미 지원 완료')
+
+    @mock.patch.object(db_router, 'replica_configured', return_value=True)
+    def test_get_request_that_writes_sets_the_pin(self, _):
+        def view(request):
+            User.objects.create_user('written-on-get')
+            return HttpResponse()
+
+        middleware = db_router.ReplicaRoutingMiddleware(view)
+        self.assertIn(db_router.PIN_COOKIE_NAME, middleware(RequestFactory().get('/')).cookies)
+        read_only = db_router.ReplicaRoutingMiddleware(lambda request: HttpResponse())
+        self.assertNotIn(db_router.PIN_COOKIE_NAME, read_only(RequestFactory().get('/')).cookies)
+
+
+# -------------------- 공개 피드 스냅샷 --------------------
+
+class FeedSnapshotTests(TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        for name, value in (('FEED_SNAPSHOTS_ENABLED', True), ('FEED_SNAPSHOT_ROOT', Path(temp_dir.name))):
+            patcher = mock.patch.object(snapshots, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_anonymous_feed_is_served_from_published_snapshot(self):
+        registrant = User.objects.create_user('registrant')
+        Task.objects.create(
+            title='스냅샷 심부름', content='내용', reward_points=100, location='정문',
+            due_date=timezone.now() + timedelta(days=1), registrant=registrant,
+        )
+        self.assertEqual(snapshots.publish_feed_snapshots(), 18)  # 성별 3 × 별점 6, 2페이지 이상 없음
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('home'))
+        self.assertContains(response, '스냅샷 심부름')
+        self.assertEqual(len(queries), 0)
+
+        # 로그인 사용자는 항상 직접 렌더링합니다.
+        self.client.force_login(registrant)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('home'))
+        self.assertGreater(len(queries), 0)
+
+
+# -------------------- Jinja2 핫 템플릿 --------------------
+
+JINJA2_TEMPLATES = [{
+    'BACKEND': 'django.template.backends.jinja2.Jinja2',
+    'DIRS': [],
+    'APP_DIRS': True,
+    'OPTIONS': {
+        'environment': 'core.jinja2env.environment',
+        'context_processors': settings.TEMPLATES[-1]['OPTIONS']['context_processors'],
+    },
+}] + settings.TEMPLATES[-1:]
+
+
+class Jinja2ParityTests(TestCase):
+    """ core/jinja2 의 템플릿은 core/templates 의 같은 이름 템플릿과 같은 HTML 을 만들어야 합니다. """
+
+    maxDiff = None
+
+    def setUp(self):
+        self.registrant = User.objects.create_user('registrant')
+        self.task = Task.objects.create(
+            title='<script>alert("x")</script> & 간식', content='첫 줄 <b>굵게</b>\n둘째 줄 \'따옴표\'',
+            reward_points=100, location='기숙사 & 정문', registrant=self.registrant,
+            due_date=timezone.make_aware(timezone.datetime(2025, 1, 2, 9, 5)),
+        )
+        Task.objects.filter(pk=self.task.pk).update(created_at=timezone.make_aware(timezone.datetime(2024, 12, 31, 23, 30)))
+        TaskApplication.objects.create(task=self.task, applicant=User.objects.create_user('<i>helper</i>'))
+
+    def render_both(self, *requests):
+        """ 두 엔진으로 같은 요청들을 보내고, 공백과 CSRF 토큰 값을 정규화한 HTML 을 반환합니다. """
+        pages = []
+        for templates in (settings.TEMPLATES, JINJA2_TEMPLATES):
+            with override_settings(TEMPLATES=templates):
+                html = ''.join(request().content.decode() for request in requests)
+            html = re.sub(r'(name="csrfmiddlewaretoken" value=")[^"]+', r'\1TOKEN', html)
+            # markupsafe 는 따옴표를 숫자 참조로 씁니다. (브라우저에서는 같은 문자)
+            html = html.replace('&#34;', '&quot;').replace('&#39;', '&#x27;')
+            pages.append(re.sub(r'\s+', ' ', re.sub(r'>\s+<', '><', html)).strip())
+        return pages
+
+    def test_task_list_matches(self):
+        self.client.force_login(self.registrant)
+        django_html, jinja2_html = self.render_both(
+            lambda: self.client.get(reverse('home')),
+            lambda: self.client.get(reverse('home'), {'gender': 'A', 'page': 'x'}),
+        )
+        self.assertEqual(jinja2_html, django_html)
+        self.assertIn('&lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; &amp; 간식', django_html)
+        self.assertIn('2025년 01월 02일 09시 05분', django_html)
+
+        self.client.logout()
+        django_html, jinja2_html = self.render_both(lambda: self.client.get(reverse('home')))
+        self.assertEqual(jinja2_html, django_html)
+
+    def test_task_detail_matches_with_message_and_csrf_forms(self):
+        self.client.force_login(self.registrant)
+        # 본인 공고 지원은 실패 메시지와 함께 상세 페이지로 돌아갑니다. (메시지는 한 번 표시되면 사라짐)
+        django_html, jinja2_html = self.render_both(
+            lambda: self.client.post(reverse('task_apply', args=[self.task.pk]), follow=True),
+        )
+        self.assertEqual(jinja2_html, django_html)
+        self.assertIn('본인이 등록한 심부름에는 지원할 수 없습니다.', django_html)
+        self.assertIn('name="csrfmiddlewaretoken" value="TOKEN"', django_html)
+        self.assertIn('&lt;i&gt;helper&lt;/i&gt;', django_html)
+        # 현지 시간대(Asia/Seoul) 기준 날짜 형식
+        self.assertIn('등록일: 2024.12.31 23:30', django_html)
+        self.assertIn('2025년 01월 02일 09시 05분', django_html)
+
+        self.client.logout()
+        django_html, jinja2_html = self.render_both(lambda: self.client.get(reverse('task_detail', args=[self.task.pk])))
+        self.assertEqual(jinja2_html, django_html)
+
+
+# -------------------- 운영 통계 롤업 --------------------
+
+class RollupTests(TestCase):
+
+    def setUp(self):
+        self.registrant = User.objects.create_user('registrant')
+
+    def at(self, hour, minute):
+        return timezone.make_aware(timezone.datetime(2025, 3, 10, hour, minute))
+
+    def task_created_at(self, when, **fields):
+        task = Task.objects.create(
+            title='심부름', content='내용', reward_points=100, location='정문',
+            due_date=when + timedelta(days=1), registrant=self.registrant, **fields,
+        )
+        Task.objects.filter(pk=task.pk).update(created_at=when)
+        return task
+
+    def hourly(self):
+        return {
+            timezone.localtime(row.bucket_start).hour: (row.tasks_created, row.tasks_completed, row.points_paid)
+            for row in StatsRollup.objects.filter(granularity='hour')
+        }
+
+    def test_late_rows_inside_lag_are_recounted_and_buckets_replaced(self):
+        lag = timedelta(minutes=5)
+        self.task_created_at(self.at(11, 10))
+        rollups.run_rollup('hour', now=self.at(12, 3), lag=lag)
+        self.assertEqual(self.hourly(), {11: (1, 0, 0)})
+
+        # 워터마크(12:03) 이전 시각으로 늦게 커밋된 행: lag 안(11:59)은 반영, 이미 닫힌 구간(10:30)은 제외
+        self.task_created_at(self.at(11, 59))
+        self.task_created_at(self.at(10, 30))
+        self.task_created_at(self.at(12, 10), status='completed', closed_at=self.at(12, 20))
+        rollups.run_rollup('hour', now=self.at(12, 30), lag=lag)
+        # 11시 구간은 더해지지 않고 다시 계산된 값으로 교체됩니다.
+        self.assertEqual(self.hourly(), {11: (2, 0, 0), 12: (1, 1, 100)})
+
+        # --rebuild 는 처음부터 다시 집계해 lag 밖의 행도 반영합니다.
+        rollups.run_rollups(now=self.at(12, 30), lag=lag, rebuild=True)
+        self.assertEqual(self.hourly(), {10: (1, 0, 0), 11: (2, 0, 0), 12: (1, 1, 100)})
+
+    def test_running_twice_is_idempotent(self):
+        self.task_created_at(self.at(9, 0))
+        self.task_created_at(self.at(11, 40), status='completed', closed_at=self.at(11, 50))
+        now = self.at(12, 0)
+        rollups.run_rollups(now=now)
+        expected = self.hourly()
+        # 두 번째 실행은 워터마크 - lag 이후 구간만 다시 계산하지만 결과는 같아야 합니다.
+        rollups.run_rollups(now=now)
+        self.assertEqual(self.hourly(), expected)
+        self.assertEqual(expected, {9: (1, 0, 0), 11: (1, 1, 100)})
+        self.assertEqual(StatsRollup.objects.filter(granularity='hour').count(), 2)
+        day = StatsRollup.objects.get(granularity='day')
+        self.assertEqual((day.tasks_created, day.tasks_completed, day.points_paid), (2, 1, 100))
+
+
+# -------------------- 시그널 리시버 (CoreConfig.ready) --------------------
+
+class SignalReceiverTests(TestCase):
+
+    def test_receivers_are_connected_by_app_ready(self):
+        self.assertTrue(post_save.has_listeners(User))
+        self.assertTrue(post_save.has_listeners(Task))
+        self.assertTrue(post_save.has_listeners(TaskReview))
+
+    def test_new_user_gets_a_profile(self):
+        user = User.objects.create_user('newcomer')
+        self.assertTrue(UserProfile.objects.filter(user=user).exists())
+
+    def test_task_save_schedules_snapshot_after_commit_only_when_enabled(self):
+        registrant = User.objects.create_user('registrant')
+        with mock.patch.object(snapshots, 'schedule_publish') as schedule_publish:
+            with mock.patch.object(snapshots, 'FEED_SNAPSHOTS_ENABLED', False):
+                with self.captureOnCommitCallbacks(execute=True):
+                    task = Task.objects.create(
+                        title='심부름', content='내용', reward_points=10, location='정문',
+                        due_date=timezone.now() + timedelta(days=1), registrant=registrant,
+                    )
+            schedule_publish.assert_not_called()
+
+            with mock.patch.object(snapshots, 'FEED_SNAPSHOTS_ENABLED', True):
+                with self.captureOnCommitCallbacks() as callbacks:
+                    task.delete()
+                schedule_publish.assert_not_called()  # 커밋 전에는 예약하지 않음
+                for callback in callbacks:
+                    callback()
+            schedule_publish.assert_called_once_with()
+
+    def test_review_summary_follows_orm_changes_and_deletes(self):
+        reviewer, other = User.objects.create_user('reviewer'), User.objects.create_user('other')
+        helper = User.objects.create_user('summary-helper')
+
+        def summary(user):
+            profile = UserProfile.objects.get(user=user)
+            return profile.review_count, profile.rating_sum, profile.rating_4_count, profile.rating_2_count
+
+        review = TaskReview.objects.create(reviewer=reviewer, reviewed_user=helper, rating=4)
+        self.assertEqual(summary(helper), (1, 4, 1, 0))
+
+        review.rating = 2
+        review.save()
+        self.assertEqual(summary(helper), (1, 2, 0, 1))
+
+        review.reviewed_user = other
+        review.save()
+        self.assertEqual(summary(helper), (0, 0, 0, 0))
+        self.assertEqual(summary(other), (1, 2, 0, 1))
+        self.assertEqual(LeaderboardEntry.objects.get(user=other, period='all').rating_count, 1)
+        self.assertEqual(LeaderboardEntry.objects.get(user=helper, period='all').rating_count, 0)
+
+        # 작성자를 지우면 CASCADE 로 리뷰가 지워지고 요약에서도 빠집니다.
+        TaskReview.objects.create(reviewer=reviewer, reviewed_user=other, rating=4)
+        self.assertEqual(summary(other), (2, 6, 1, 1))
+        reviewer.delete()
+        self.assertEqual(summary(other), (0, 0, 0, 0))
+        self.assertEqual(LeaderboardEntry.objects.get(user=other, period='all').rating_sum, 0)
+
+
+# -------------------- 워커 예열 --------------------
+
+class WarmUpTests(SimpleTestCase):
+
+    def test_warm_up_compiles_templates_and_resolves_urls(self):
+        timings = warmup.warm_up()
+        self.assertEqual(list(timings), ['compile_templates', 'resolve_url_names'])
+        self.assertGreater(timings['compile_templates']['result'], 0)
+        self.assertGreater(timings['resolve_url_names']['result'], 0)
+
+    def test_failed_step_does_not_stop_worker_start(self):
+        with mock.patch.object(warmup, 'resolve_url_names', side_effect=RuntimeError('boom'), __name__='resolve_url_names'):
+            with self.assertLogs('core.warmup', 'ERROR'):
+                timings = warmup.warm_up()
+        self.assertIsNone(timings['resolve_url_names']['result'])
+        self.assertGreater(timings['compile_templates']['result'], 0)
+
+    def test_disabled_by_environment(self):
+        with mock.patch.dict('os.environ', {'DJANGO_WARMUP': '0'}):
+            self.assertFalse(warmup.warmup_enabled())
+        with mock.patch.dict('os.environ', {}, clear=True):
+            self.assertTrue(warmup.warmup_enabled())
+
+
+
+class FeedSnapshotLockTests(TransactionTestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        for name, value in (('FEED_SNAPSHOTS_ENABLED', True), ('FEED_SNAPSHOT_ROOT', self.root)):
+            patcher = mock.patch.object(snapshots, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @mock.patch.object(snapshots, 'schedule_publish')
+    def test_publish_reads_and_writes_under_the_file_lock(self, schedule_publish):
+        registrant = User.objects.create_user('registrant')
+
+        def publish():
+            try:
+                snapshots.publish_feed_snapshots()
+            finally:
+                connections.close_all()
+
+        # 다른 워커가 발행 중인 상황: 잠금이 풀릴 때까지 기다렸다가 그때의 DB 를 읽어 씁니다.
+        with snapshots._publish_lock_file():
+            waiting = threading.Thread(target=publish)
+            waiting.start()
+            waiting.join(0.3)
+            self.assertTrue(waiting.is_alive())
+            self.assertFalse(snapshots.snapshot_path('A', 0, 1).exists())
+            Task.objects.create(
+                title='나중에 등록된 심부름', content='내용', reward_points=10, location='정문',
+                due_date=timezone.now() + timedelta(days=1), registrant=registrant,
+            )
+        waiting.join()
+        self.assertIn('나중에 등록된 심부름', snapshots.snapshot_path('A', 0, 1).read_text())
+
+
+# -------------------- SQLite 유지보수 --------------------
+
+class DatabaseReportTests(TestCase):
+
+    def test_report_includes_object_sizes_and_model_row_counts(self):
+        User.objects.create_user('someone')
+        report = db_maintenance.database_report()
+
+        self.assertEqual(report['row_counts']['core.UserProfile'], 1)
+        self.assertIn('core_task', report['tables'])
+        self.assertEqual(report['indexes']['review_received_page_idx']['table'], 'core_taskreview')
+        self.assertGreaterEqual(report['freelist_ratio'], 0)
+
+    def test_incremental_vacuum_stops_when_a_step_frees_nothing(self):
+        pragmas = {'auto_vacuum': 2, 'freelist_count': 5}
+        with mock.patch.object(db_maintenance, '_pragma', side_effect=lambda cursor, name: pragmas[name]):
+            self.assertEqual(db_maintenance.incremental_vacuum(max_steps=None, pause=0), 0)
+
+    def test_expired_sessions_are_deleted_in_batches(self):
+        now = timezone.now()
+        Session.objects.bulk_create(
+            [Session(session_key=f'expired{i}', session_data='', expire_date=now - timedelta(days=1)) for i in range(5)]
+            + [Session(session_key='active', session_data='', expire_date=now + timedelta(days=1))]
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(db_maintenance.delete_expired_sessions(batch_size=2), 5)
+        self.assertEqual(sum(query['sql'].startswith('DELETE') for query in queries), 3)
+        self.assertEqual(list(Session.objects.values_list('pk', flat=True)), ['active'])
+
+
+# -------------------- 스태프 요청 프로파일러 --------------------
+
+class ProfilerMiddlewareTests(TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        for name, value in (('PROFILER_ROOT', Path(temp_dir.name)), ('PROFILER_MAX_REPORTS', 2)):
+            patcher = mock.patch.object(profiler, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_only_flagged_staff_requests_are_profiled(self):
+        self.client.force_login(User.objects.create_user('someone'))
+        self.assertNotIn('X-Profile-Report', self.client.get(reverse('profile') + '?_profile=1'))
+
+        self.client.force_login(User.objects.create_user('staff', is_staff=True))
+        self.assertNotIn('X-Profile-Report', self.client.get(reverse('profile')))
+        response = self.client.get(reverse('profile'), headers={'X-Profile': '1'})
+        report = profiler.load_report(response['X-Profile-Report'])
+        self.assertEqual(report['sql_count'], len(report['queries']))
+        self.assertTrue(any('core/views.py' in frame for query in report['queries'] for frame in query['origin']))
+
+        detail = self.client.get(reverse('profiler_report', args=[response['X-Profile-Report']]))
+        self.assertEqual(detail.status_code, 200)
+
+    def test_query_flag_must_match_exactly(self):
+        factory = RequestFactory()
+        self.assertTrue(profiler.profiling_requested(factory.get('/', {'_profile': '1'})))
+        for query in ('x_profile=1', '_profile=10', 'a=_profile=1'):
+            with self.subTest(query=query):
+                self.assertFalse(profiler.profiling_requested(factory.get(f'/?{query}')))
+
+    def test_retention_cap(self):
+        for _ in range(3):
+            profiler.save_report({'path': '/'})
+        self.assertEqual(len(profiler.list_reports()), 2)
+
+
+# -------------------- 심부름 지원 (단일 문장) --------------------
+
+class TaskApplyTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.registrant = User.objects.create_user('registrant')
+        cls.helper = User.objects.create_user('helper')
+        cls.task = Task.objects.create(
+            title='지원 심부름', content='내용', reward_points=10, location='교내',
+            due_date=timezone.now() + timedelta(days=1), registrant=cls.registrant, min_rating_required=4,
+        )
+
+    def test_apply_checks_status_rating_and_duplicates_in_the_insert(self):
+        apply = TaskApplication.apply
+        self.assertEqual(apply(self.task.pk, self.registrant.pk), TaskApplication.NOT_ELIGIBLE)
+        self.assertEqual(apply(self.task.pk, self.helper.pk), TaskApplication.NOT_ELIGIBLE)
+
+        # 평균 3.95 는 UserProfile.average_rating 기준으로 4.0 이므로 통과합니다.
+        UserProfile.objects.filter(user=self.helper).update(rating_sum=79, review_count=20)
+        with self.assertNumQueries(3):  # SAVEPOINT, INSERT ... SELECT, RELEASE
+            self.assertEqual(apply(self.task.pk, self.helper.pk), TaskApplication.APPLIED)
+        self.assertEqual(apply(self.task.pk, self.helper.pk), TaskApplication.DUPLICATE)
+
+        Task.objects.filter(pk=self.task.pk).update(status='assigned')
+        other = User.objects.create_user('other')
+        UserProfile.objects.filter(user=other).update(rating_sum=5, review_count=1)
+        self.assertEqual(apply(self.task.pk, other.pk), TaskApplication.NOT_ELIGIBLE)
+        self.assertEqual(TaskApplication.objects.filter(task=self.task).count(), 1)
+
+    def test_sql_rating_check_matches_average_rating(self):
+        # 1.95 는 float 로는 1.9499... 이라 round(1.95, 1) == 1.9 였지만, 두 곳 모두 2.0 으로 올림합니다.
+        profile = UserProfile.objects.get(user=self.helper)
+        for rating_sum, review_count, min_rating in ((39, 20, 2), (79, 20, 4), (78, 20, 4), (82, 21, 4), (83, 21, 4), (19, 10, 2)):
+            with self.subTest(rating_sum=rating_sum, review_count=review_count, min_rating=min_rating):
+                TaskApplication.objects.all().delete()
+                Task.objects.filter(pk=self.task.pk).update(status='open', min_rating_required=min_rating)
+                UserProfile.objects.filter(pk=profile.pk).update(rating_sum=rating_sum, review_count=review_count)
+                profile.refresh_from_db()
+                applied = TaskApplication.apply(self.task.pk, self.helper.pk) == TaskApplication.APPLIED
+                self.assertEqual(applied, profile.average_rating >= min_rating)
+        self.assertEqual(profile.average_rating, 1.9)  # 19 / 10
+        UserProfile.objects.filter(pk=profile.pk).update(rating_sum=39, review_count=20)
+        profile.refresh_from_db()
+        self.assertEqual(profile.average_rating, 2.0)
+
+
+# -------------------- 요청 제한 --------------------
+
+class RateLimitTests(TestCase):
+
+    def setUp(self):
+        ratelimit.caches[ratelimit.RATELIMIT_CACHE].clear()
+
+    def test_token_bucket_refills_over_time(self):
+        limit = ratelimit.Limit('60/m', burst=2)
+        self.assertEqual(ratelimit.take_token('test', 'ip:1', limit, now=100), 0)
+        self.assertEqual(ratelimit.take_token('test', 'ip:1', limit, now=100), 0)
+        self.assertAlmostEqual(ratelimit.take_token('test', 'ip:1', limit, now=100), 1)
+        # 다른 클라이언트는 별도 버킷
+        self.assertEqual(ratelimit.take_token('test', 'ip:2', limit, now=100), 0)
+        self.assertEqual(ratelimit.take_token('test', 'ip:1', limit, now=101), 0)
+
+    def test_user_search_returns_429_when_bucket_is_empty(self):
+        self.client.force_login(User.objects.create_user('searcher'))
+        burst = 10
+        for _ in range(burst):
+            self.assertEqual(self.client.get(reverse('user_search'), {'search_query': 'a'}).status_code, 200)
+        response = self.client.get(reverse('user_search'), {'search_query': 'a'})
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+
+    @mock.patch.object(ratelimit, 'RATELIMIT_MAX_CONCURRENT', 0)
+    def test_expensive_requests_are_shed_over_concurrency_cap(self):
+        self.assertEqual(self.client.get(reverse('home'), {'min_rating': '3'}).status_code, 503)
+        # 최소 별점 필터가 없는 목록은 제한 대상이 아닙니다.
+        self.assertEqual(self.client.get(reverse('home')).status_code, 200)
+
+    def test_client_ip_skips_only_trusted_proxies(self):
+        request = RequestFactory().get('/', REMOTE_ADDR='10.0.0.2', HTTP_X_FORWARDED_FOR='6.6.6.6, 1.2.3.4, 10.0.0.1')
+        for proxy_count, expected in ((0, '10.0.0.2'), (1, '10.0.0.1'), (2, '1.2.3.4'), (9, '6.6.6.6')):
+            with mock.patch.object(ratelimit, 'RATELIMIT_TRUSTED_PROXY_COUNT', proxy_count):
+                self.assertEqual(ratelimit.client_ip(request), expected)
+
+    @mock.patch.object(ratelimit, 'RATELIMIT_MAX_CONCURRENT', 1)
+    def test_in_flight_counter_lives_in_the_shared_cache(self):
+        cache = ratelimit.caches[ratelimit.RATELIMIT_CACHE]
+        self.assertTrue(ratelimit._enter_expensive())
+        self.assertFalse(ratelimit._enter_expensive())
+        self.assertEqual(cache.get(ratelimit.IN_FLIGHT_KEY), 1)
+        ratelimit._leave_expensive()
+        self.assertEqual(cache.get(ratelimit.IN_FLIGHT_KEY), 0)
+        self.assertEqual(self.client.get(reverse('home'), {'min_rating': '3'}).status_code, 200)
+        self.assertEqual(cache.get(ratelimit.IN_FLIGHT_KEY), 0)
+
+    @mock.patch.object(ratelimit, 'RATELIMIT_MAX_CONCURRENT', 2)
+    @mock.patch.object(ratelimit, 'IN_FLIGHT_TIMEOUT', 1)
+    def test_in_flight_counter_does_not_expire_under_sustained_load(self):
+        cache = ratelimit.caches[ratelimit.RATELIMIT_CACHE]
+        clock = mock.patch('django.core.cache.backends.locmem.time.time', return_value=1000.0)
+        now = clock.start()
+        self.addCleanup(clock.stop)
+
+        self.assertTrue(ratelimit._enter_expensive())
+        self.assertTrue(ratelimit._enter_expensive())
+        # 거절된 요청도 만료 시각을 연장하므로, 처음 add 후 1초가 지나도 두 요청이 계속 세어집니다.
+        for elapsed in (0.8, 1.6, 2.4):
+            now.return_value = 1000.0 + elapsed
+            self.assertFalse(ratelimit._enter_expensive())
+        self.assertEqual(cache.get(ratelimit.IN_FLIGHT_KEY), 2)
+        ratelimit._leave_expensive()
+        ratelimit._leave_expensive()
+        self.assertEqual(cache.get(ratelimit.IN_FLIGHT_KEY), 0)
+
+        # 오래 요청이 없어 만료된 뒤에는 늦게 끝난 요청의 decr 가 카운터를 음수로 만들지 않습니다.
+        self.assertTrue(ratelimit._enter_expensive())
+        now.return_value += 5
+        ratelimit._leave_expensive()
+        self.assertTrue(ratelimit._enter_expensive())
+        self.assertEqual(cache.get(ratelimit.IN_FLIGHT_KEY), 1)
+
+
+# -------------------- 정적 파일 서빙 --------------------
+
+class StaticFilesMiddlewareTests(SimpleTestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        for name in ('site.0123456789ab.css', 'site.css'):
+            (self.root / name).write_text('body { padding-top: 60px; }\n' * 50)
+            compress_file(str(self.root / name))
+
+    def get(self, name, **headers):
+        with override_settings(STATIC_ROOT=self.root):
+            middleware = StaticFilesMiddleware(lambda request: HttpResponse(status=404))
+            return middleware(RequestFactory().get(f'/static/{name}', headers=headers))
+
+    def test_hashed_file_is_immutable_and_precompressed(self):
+        response = self.get('site.0123456789ab.css', **{'Accept-Encoding': 'gzip, br;q=0'})
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertIn('immutable', response['Cache-Control'])
+        response.close()
+
+        response = self.get('site.0123456789ab.css')
+        self.assertNotIn('Content-Encoding', response)
+        response.close()
+
+    def test_unhashed_file_is_revalidated(self):
+        response = self.get('site.css')
+        self.assertIn('must-revalidate', response['Cache-Control'])
+        response.close()
+        self.assertEqual(self.get('site.css', **{'If-Modified-Since': response['Last-Modified']}).status_code, 304)
+        self.assertEqual(self.get('../settings.py').status_code, 404)
+
+
+class ProductionStaticProfileTests(TestCase):
+
+    def load_settings(self, **environ):
+        with mock.patch.dict('os.environ', environ):
+            return runpy.run_path(str(Path(__file__).resolve().parent.parent / 'config' / 'settings.py'))
+
+    def test_profile_turns_debug_off_and_refuses_debug(self):
+        production = self.load_settings(DJANGO_STATIC_PROFILE='production')
+        self.assertFalse(production['DEBUG'])
+        self.assertIn('core.static_assets.StaticFilesMiddleware', production['MIDDLEWARE'])
+        with self.assertRaises(ImproperlyConfigured):
+            self.load_settings(DJANGO_STATIC_PROFILE='production', DJANGO_DEBUG='1')
+
+    def test_pages_link_hashed_assets(self):
+        static_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, static_root, ignore_errors=True)
+        production = self.load_settings(DJANGO_STATIC_PROFILE='production')
+        with override_settings(DEBUG=production['DEBUG'], STATIC_ROOT=static_root, STORAGES=production['STORAGES']):
+            call_command('collectstatic', interactive=False, verbosity=0)
+            html = self.client.get(reverse('home')).content.decode()
+        self.assertRegex(html, r'/static/core/css/site\.[0-9a-f]{12}\.css')
+
+
+# -------------------- 도우미 리더보드 --------------------
+
+class LeaderboardTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.helpers = [User.objects.create_user(f'helper{i}') for i in range(3)]
+
+    def complete(self, user, reward):
+        with self.captureOnCommitCallbacks(execute=True):
+            leaderboard.record_completion(user, reward)
+
+    def test_record_completion_updates_every_period(self):
+        self.complete(self.helpers[0], 100)
+        self.complete(self.helpers[0], 50)
+        entries = LeaderboardEntry.objects.filter(user=self.helpers[0])
+        self.assertEqual(sorted(entries.values_list('period', flat=True)), ['all', 'month', 'week'])
+        self.assertEqual({(entry.score, entry.tasks_completed) for entry in entries}, {(150, 2)})
+
+    @mock.patch.object(leaderboard, 'LEADERBOARD_SIZE', 2)
+    def test_cached_top_list_is_refreshed_and_evicts_lowest(self):
+        first, second, third = self.helpers
+        self.complete(first, 300)
+        self.complete(second, 200)
+        self.assertEqual([row['user_id'] for row in leaderboard.top_helpers()], [first.pk, second.pk])
+
+        # 캐시가 있는 상태에서 세 번째 도우미가 1위로 올라오면 최하위가 밀려납니다.
+        self.complete(third, 500)
+        with self.assertNumQueries(0):
+            top = leaderboard.top_helpers()
+        self.assertEqual([row['user_id'] for row in top], [third.pk, first.pk])
+
+    def test_week_bucket_boundary(self):
+        seoul = timezone.get_current_timezone()
+        sunday_night = timezone.make_aware(timezone.datetime(2024, 12, 29, 23, 59), seoul)
+        monday = timezone.make_aware(timezone.datetime(2024, 12, 30, 0, 0), seoul)
+        self.assertEqual(leaderboard.current_bucket('week', sunday_night), '2024-W52')
+        # ISO 주차 기준이므로 12월 30일은 다음 해 1주차입니다.
+        self.assertEqual(leaderboard.current_bucket('week', monday), '2025-W01')
+        self.assertEqual(leaderboard.current_bucket('month', monday), '2024-12')
+
+    @mock.patch.object(leaderboard, 'LEADERBOARD_SIZE', 1)
+    def test_rank_of_breaks_ties_by_completions_then_user(self):
+        first, second, third = self.helpers
+        self.complete(first, 100)
+        self.complete(second, 50)
+        self.complete(second, 50)   # 같은 점수, 완료 수가 더 많음
+        self.complete(third, 100)   # first 와 완전히 같음 → user_id 순
+        leaderboard.top_helpers()   # 1위만 캐시
+
+        self.assertEqual(leaderboard.rank_of(second)[0], 1)
+        self.assertEqual(leaderboard.rank_of(first)[0], 2)
+        self.assertEqual(leaderboard.rank_of(third)[0], 3)
+        self.assertEqual(leaderboard.rank_of(User.objects.create_user('nobody')), (None, None))
@@ -2,6 +2,7 @@
 
 from django.urls import path
 from . import views # core/views.py 파일의 함수들을 사용하기 위해 임포트
+from .ratelimit import Limit, apply_limits
 
 urlpatterns = [
     # 1. 메인 페이지 (심부름 목록이 됨)
@@ -9,6 +10,8 @@ urlpatterns = [
     
     # 2. 프로필 페이지
     path('profile/', views.profile, name='profile'),
+    # 2-1. 받은 리뷰 목록 '더 보기' (HTML 조각, ?cursor=...)
+    path('profile/reviews/', views.profile_reviews, name='profile_reviews'),
     
     # 3. 회원가입 페이지
     path('signup/', views.signup, name='signup'),
@@ -25,6 +28,8 @@ urlpatterns = [
     
     # 8. 심부름 리뷰 작성 페이지
     path('task/<int:pk>/review/', views.task_review, name='task_review'),
+    # 8-1. 내 심부름 대시보드 (등록 / 수행 / 지원)
+    path('task/mine/', views.my_tasks, name='my_tasks'),
     
     # --- 5. 사용자 검색 및 일반 리뷰 URL ⭐ 새로 추가된 경로 ⭐ ---
     
@@ -33,4 +38,20 @@ urlpatterns = [
     
     # 10. 특정 사용자에게 리뷰 남기기
     path('users/<str:username>/review/', views.user_review, name='user_review'),
-]
\ No newline at end of file
+
+    # --- 6. 도우미 리더보드 ---
+    # 11. 리더보드 (?period=all|week|month)
+    path('leaderboard/', views.leaderboard_view, name='leaderboard'),
+]
+
+# --- 요청 제한 (core/ratelimit.py) ---
+# URL 이름: 로그인 사용자는 사용자별, 그 외에는 IP 별 토큰 버킷 + 비싼 요청 동시 실행 상한
+RATE_LIMITS = {
+    # 인덱스를 쓰지 못하는 username icontains 검색
+    'user_search': Limit('30/m', burst=10),
+    # 최소 별점 필터는 사용자 평균 별점 집계가 필요하므로 그 경우에만 제한합니다.
+    'home': Limit('60/m', burst=20, when=lambda request: bool(request.GET.get('min_rating'))),
+    # 지원 폭주 (같은 사용자의 연속 클릭 포함)
+    'task_apply': Limit('20/m', burst=5),
+}
+urlpatterns = apply_limits(urlpatterns, RATE_LIMITS)
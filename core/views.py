@@ -1,26 +1,25 @@
+from datetime import datetime, timezone as dt_timezone
+from urllib.parse import urlencode
+
+from django.core.paginator import Paginator
+from django.http import HttpResponse, HttpResponseBadRequest
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib import messages
-from django.db.models.signals import post_save
-from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.db.models import Q, Avg 
+from django.db.models import Q, Avg, Count, Prefetch
+from django.views.decorators.http import require_POST
 
 # ⭐ UserSearchForm 임포트 추가 ⭐
 from .forms import TaskForm, TitleForm, ReviewForm, UserSearchForm 
-from .models import UserProfile, Task, TaskApplication, TaskReview
+from .models import UserProfile, Task, TaskApplication, TaskReview, LeaderboardEntry, ArchivedTask
+from . import leaderboard, snapshots
+from .archive import get_task_or_archived
 
 User = get_user_model()
 
-# -------------------- 회원가입 및 프로필 생성 자동화 --------------------
-
-@receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
-    if created:
-        UserProfile.objects.create(user=instance)
-
 # -------------------- View 함수 정의 --------------------
 
 # 2. 회원가입 View
@@ -74,25 +73,77 @@ def profile(request):
         'title_badge': profile.selected_title, 
         'title_form': form, 
         'average_rating': profile.average_rating, 
-        # 자신이 받은 모든 리뷰 목록 (심부름 리뷰, 일반 리뷰 모두 포함)
-        'received_reviews': profile.user.received_reviews.all().select_related('reviewer').order_by('-created_at'),
+        # 리뷰 요약은 미리 집계된 컬럼에서 읽습니다. (리뷰 테이블 집계 없음)
+        'review_count': profile.review_count,
+        'rating_histogram': profile.rating_histogram,
+        # 받은 리뷰는 첫 페이지만 렌더링하고, 나머지는 profile_reviews 조각으로 불러옵니다.
+        **received_reviews_page(request.user),
     }
     return render(request, 'core/profile.html', context)
 
 
+# 3-1. 받은 리뷰 목록 조각 (더 보기, 로그인 필요)
+REVIEW_PAGE_SIZE = 10
+
+
+def _encode_review_cursor(review):
+    created_at = review.created_at.astimezone(dt_timezone.utc)
+    return f'{int(created_at.timestamp())}.{created_at.microsecond:06d}.{review.pk}'
+
+
+def _decode_review_cursor(cursor):
+    try:
+        seconds, microseconds, pk = (int(part) for part in cursor.split('.'))
+        created_at = datetime.fromtimestamp(seconds, tz=dt_timezone.utc).replace(microsecond=microseconds)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return created_at, pk
+
+
+def received_reviews_page(user, cursor=None):
+    """ (작성일, id) 키셋 기준으로 받은 리뷰 한 페이지와 다음 페이지 커서를 반환합니다. """
+    reviews = (
+        TaskReview.objects
+        .filter(reviewed_user=user)
+        .select_related('reviewer')
+        .only('rating', 'comment', 'created_at', 'reviewer__username')
+        .order_by('-created_at', '-id')
+    )
+    if cursor:
+        created_at, pk = cursor
+        reviews = reviews.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+    # 한 개를 더 읽어 다음 페이지가 있는지 확인합니다.
+    page = list(reviews[:REVIEW_PAGE_SIZE + 1])
+    next_cursor = None
+    if len(page) > REVIEW_PAGE_SIZE:
+        page = page[:REVIEW_PAGE_SIZE]
+        next_cursor = _encode_review_cursor(page[-1])
+    return {'received_reviews': page, 'next_cursor': next_cursor}
+
+
+@login_required
+def profile_reviews(request):
+    """ 프로필 페이지의 '더 보기' 요청에 받은 리뷰 다음 페이지를 HTML 조각으로 응답합니다. """
+    cursor = _decode_review_cursor(request.GET.get('cursor', ''))
+    if cursor is None:
+        return HttpResponseBadRequest('잘못된 커서입니다.')
+    return render(request, 'core/_received_reviews.html', received_reviews_page(request.user, cursor))
+
+
 # 4. 심부름 목록 (메인 페이지) - ⭐ 조건 필터링 로직 추가
-def task_list(request):
-    # 1. 기본 쿼리셋 설정 (open 상태 또는 등록자 심부름)
-    if request.user.is_authenticated:
-        tasks_queryset = Task.objects.filter(
-            Q(status='open') | Q(registrant=request.user)
-        )
-    else:
-        tasks_queryset = Task.objects.filter(status='open')
+TASKS_PER_PAGE = 20
+
+
+def task_feed_context(user, params):
+    """ 심부름 목록 페이지의 컨텍스트를 만듭니다. (task_list 뷰와 공개 피드 스냅샷이 함께 사용) """
+    # 1. 기본 쿼리셋 설정 (모집 중인 심부름만, (status, -created_at) 인덱스 사용)
+    # 내가 등록한 심부름은 my_tasks 대시보드에서 봅니다.
+    tasks_queryset = Task.objects.filter(status='open')
     
     # 2. 필터링 파라미터 확인 및 적용
-    min_rating = request.GET.get('min_rating')
-    required_gender = request.GET.get('gender')
+    min_rating = params.get('min_rating')
+    required_gender = params.get('gender')
 
     # 2-1. 최소 별점 필터링
     if min_rating and min_rating.isdigit() and int(min_rating) > 0:
@@ -115,18 +166,94 @@ def task_list(request):
     else:
         required_gender = 'A'
 
-    # 최종 정렬
-    tasks = tasks_queryset.order_by('-created_at')
+    # 최종 정렬 (등록자 이름을 함께 가져와 목록의 행마다 쿼리가 나가지 않도록 합니다)
+    tasks = tasks_queryset.select_related('registrant').order_by('-created_at')
+
+    # 3. 페이지 나누기
+    page_obj = Paginator(tasks, TASKS_PER_PAGE).get_page(params.get('page'))
+    filter_query = urlencode({
+        key: value for key, value in (('min_rating', min_rating), ('gender', required_gender)) if value and value != 'A'
+    })
         
-    context = {
-        'tasks': tasks,
+    return {
+        'tasks': page_obj.object_list,
+        'page_obj': page_obj,
+        'filter_query': filter_query,
         # 템플릿에 현재 필터 값과 선택지 전달
         'current_min_rating': min_rating,
         'rating_choices': TaskReview.RATING_CHOICES, 
         'current_gender': required_gender,
         'gender_choices': Task.GENDER_CHOICES, # 모델에서 정의된 성별 선택지
     }
-    return render(request, 'core/task_list.html', context)
+
+
+def task_list(request):
+    # 로그인하지 않은 방문자는 미리 렌더링된 공개 피드 스냅샷을 받습니다. (없으면 직접 렌더링)
+    if not request.user.is_authenticated:
+        snapshot = snapshots.snapshot_for_request(request.GET)
+        if snapshot is not None:
+            return HttpResponse(snapshot)
+
+    return render(request, 'core/task_list.html', task_feed_context(request.user, request.GET))
+
+
+# 4-1. 내 심부름 대시보드 (로그인 필요)
+MY_TASKS_SECTION_SIZE = 20
+
+
+@login_required
+def my_tasks(request):
+    """ 내가 등록한 / 맡은 / 지원한 심부름을 역할별로 보여줍니다. (섹션 수와 무관하게 쿼리 수 고정) """
+    user = request.user
+    size = MY_TASKS_SECTION_SIZE
+
+    # 1. 등록한 심부름: 지원자 목록과 리뷰를 함께 가져옵니다.
+    registered_tasks = (
+        Task.objects.filter(registrant=user)
+        .select_related('assigned_to', 'review')
+        .prefetch_related(
+            Prefetch('applications', queryset=TaskApplication.objects.select_related('applicant').order_by('applied_at'))
+        )
+        .order_by('-created_at')[:size]
+    )
+    # 2. 도우미로 맡은 심부름
+    assigned_tasks = (
+        Task.objects.filter(assigned_to=user)
+        .select_related('registrant', 'review')
+        .order_by('-created_at')[:size]
+    )
+    # 3. 지원한 심부름 (지원 상태와 심부름 상태를 함께 표시)
+    applications = (
+        TaskApplication.objects.filter(applicant=user)
+        .select_related('task__registrant')
+        .order_by('-applied_at')[:size]
+    )
+    # 4. 보관된 지난 심부름 (등록 또는 수행)
+    archived_tasks = (
+        ArchivedTask.objects.filter(Q(registrant=user) | Q(assigned_to=user))
+        .select_related('registrant', 'assigned_to', 'review')
+        .order_by('-created_at')[:size]
+    )
+
+    # 섹션별 전체 개수 (목록은 최근 size 개만 보여줍니다)
+    counts = Task.objects.filter(Q(registrant=user) | Q(assigned_to=user)).aggregate(
+        registered=Count('pk', filter=Q(registrant=user)),
+        registered_open=Count('pk', filter=Q(registrant=user, status='open')),
+        assigned=Count('pk', filter=Q(assigned_to=user)),
+        assigned_in_progress=Count('pk', filter=Q(assigned_to=user, status='assigned')),
+    )
+    counts['applied'] = user.applied_tasks.count()
+    counts['archived'] = ArchivedTask.objects.filter(Q(registrant=user) | Q(assigned_to=user)).count()
+
+    context = {
+        'registered_tasks': registered_tasks,
+        'assigned_tasks': assigned_tasks,
+        'applications': applications,
+        'archived_tasks': archived_tasks,
+        'counts': counts,
+        'section_size': size,
+    }
+    return render(request, 'core/my_tasks.html', context)
 
 
 # 5. 심부름 등록 (로그인 필요)
@@ -149,18 +276,19 @@ def task_create(request):
 
 # 6. 심부름 상세 보기
 def task_detail(request, pk):
-    task = get_object_or_404(Task, pk=pk)
+    # 보존 기간이 지나 보관 테이블로 옮겨진 심부름도 같은 주소로 조회됩니다.
+    task = get_task_or_archived(pk)
     
     has_applied = False
     if request.user.is_authenticated:
-        has_applied = TaskApplication.objects.filter(task=task, applicant=request.user).exists()
+        has_applied = task.applications.filter(applicant=request.user).exists()
         
     # 지원자에 대한 정보에 평균 별점을 추가하기 위해 select_related('applicant__userprofile')을 사용합니다.
-    applications = TaskApplication.objects.filter(task=task).select_related('applicant__userprofile')
+    applications = task.applications.select_related('applicant__userprofile')
     
-    # ⭐ 리뷰 작성 가능 여부 확인
+    # ⭐ 리뷰 작성 가능 여부 확인 (보관된 심부름은 리뷰 작성 불가)
     review_possible = False
-    if task.status == 'completed' and task.registrant == request.user and not hasattr(task, 'review'):
+    if not task.is_archived and task.status == 'completed' and task.registrant == request.user and not hasattr(task, 'review'):
         review_possible = True
         
     context = {
@@ -173,45 +301,32 @@ def task_detail(request, pk):
     return render(request, 'core/task_detail.html', context)
 
 
-# 7. 심부름 지원 처리 (로그인 필요)
+# 7. 심부름 지원 처리 (로그인 필요, 상태를 바꾸므로 POST 만 허용)
+# 지원은 TaskApplication.apply() 의 INSERT ... SELECT 한 문장으로 처리하고,
+# 지원에 실패한 경우에만 심부름을 다시 읽어 이유를 안내합니다.
 @login_required
-@transaction.atomic
+@require_POST
 def task_apply(request, pk):
-    task = get_object_or_404(Task, pk=pk)
-    
-    if task.registrant == request.user:
-        messages.error(request, '본인이 등록한 심부름에는 지원할 수 없습니다.')
+    result = TaskApplication.apply(task_id=pk, applicant_id=request.user.pk)
+
+    if result == TaskApplication.APPLIED:
+        messages.success(request, '심부름 지원이 완료되었습니다! 공고주의 선택을 기다려주세요.')
         return redirect('task_detail', pk=pk)
-    
-    # ⭐ 2-1. 지원자가 심부름의 최소 별점 조건을 충족하는지 확인합니다.
-    min_rating_required = task.min_rating_required
-    if min_rating_required > 0:
-        applicant_profile = request.user.userprofile
-        if applicant_profile.average_rating < min_rating_required:
-            messages.error(request, f'심부름을 수행하려면 최소 별점 {min_rating_required}점 이상이 필요합니다. 현재 별점: {applicant_profile.average_rating}점')
-            return redirect('task_detail', pk=pk)
-
-    # ⭐ 2-2. 지원자가 심부름의 성별 조건을 충족하는지 확인합니다.
-    # (현재 UserProfile에 성별 필드가 없으므로, 이 기능은 임시로 건너뛰거나, 성별 필드가 있다고 가정하고 주석 처리합니다.)
-    # required_gender = task.required_gender
-    # if required_gender != 'A' and required_gender != request.user.userprofile.gender:
-    #     messages.error(request, '성별 조건이 맞지 않아 지원할 수 없습니다.')
-    #     return redirect('task_detail', pk=pk)
-    
-    if TaskApplication.objects.filter(task=task, applicant=request.user).exists():
+
+    if result == TaskApplication.DUPLICATE:
         messages.error(request, '이미 이 심부름에 지원했습니다.')
         return redirect('task_detail', pk=pk)
 
-    if task.status != 'open':
+    task = get_task_or_archived(pk)
+    if task.registrant_id == request.user.pk:
+        messages.error(request, '본인이 등록한 심부름에는 지원할 수 없습니다.')
+    elif task.status != 'open':
         messages.error(request, '모집 중인 심부름이 아닙니다.')
-        return redirect('task_detail', pk=pk)
-        
-    TaskApplication.objects.create(
-        task=task,
-        applicant=request.user,
-        status='pending'
-    )
-    messages.success(request, f'"{task.title}" 심부름에 지원이 완료되었습니다! 공고주의 선택을 기다려주세요.')
+    else:
+        # ⭐ 지원자가 심부름의 최소 별점 조건을 충족하지 못한 경우
+        # (성별 조건은 UserProfile에 성별 필드가 생기면 apply() 의 조건에 추가합니다.)
+        average_rating = request.user.userprofile.average_rating
+        messages.error(request, f'심부름을 수행하려면 최소 별점 {task.min_rating_required}점 이상이 필요합니다. 현재 별점: {average_rating}점')
     return redirect('task_detail', pk=pk)
 
 
@@ -238,6 +353,9 @@ def task_complete(request, pk):
     assigned_profile.tasks_completed += 1
     assigned_profile.save()
 
+    # 리더보드 증분 갱신 (같은 트랜잭션 안에서 반영)
+    leaderboard.record_completion(assigned_user, reward)
+
     task.status = 'completed'
     task.save()
 
@@ -270,7 +388,7 @@ def task_review(request, pk):
             review.task = task
             review.reviewer = request.user
             review.reviewed_user = task.assigned_to # 도우미에게 리뷰를 남김
-            review.save()
+            review.save()  # 프로필 요약과 리더보드는 core/signals.py 에서 갱신
             
             messages.success(request, f'{task.assigned_to.username}님께 성공적으로 리뷰를 남겼습니다.')
             return redirect('profile')
@@ -322,7 +440,8 @@ def user_review(request, username):
         return redirect('user_search')
 
     # 이미 일반 리뷰를 남겼는지 확인 (task 필드가 null인 리뷰)
-    if TaskReview.objects.filter(reviewer=request.user, reviewed_user=reviewed_user, task__isnull=True).exists():
+    # (보관된 심부름의 리뷰도 task 가 null 이므로 archived_task 까지 확인합니다.)
+    if TaskReview.objects.filter(reviewer=request.user, reviewed_user=reviewed_user, task__isnull=True, archived_task__isnull=True).exists():
         messages.warning(request, f'{reviewed_user.username}님에게 이미 일반 리뷰를 작성하셨습니다.')
         return redirect('user_search')
 
@@ -335,7 +454,7 @@ def user_review(request, username):
             review.task = None # 심부름과 연결되지 않음 (TaskReview 모델에서 null=True 허용)
             review.reviewer = request.user
             review.reviewed_user = reviewed_user
-            review.save()
+            review.save()  # 프로필 요약과 리더보드는 core/signals.py 에서 갱신
             
             messages.success(request, f'{reviewed_user.username}님에게 성공적으로 리뷰를 남겼습니다. 감사합니다!')
             return redirect('profile')
@@ -346,4 +465,28 @@ def user_review(request, username):
         'form': form,
         'reviewed_user': reviewed_user,
     }
-    return render(request, 'core/user_review_form.html', context)
\ No newline at end of file
+    return render(request, 'core/user_review_form.html', context)
+
+
+# -------------------- ⭐ 도우미 리더보드 ⭐ --------------------
+
+# 12. 리더보드 (전체 / 주간 / 월간)
+def leaderboard_view(request):
+    """ 증분 갱신된 리더보드 테이블만 읽어 상위 도우미와 내 순위를 보여주는 뷰 """
+    period = request.GET.get('period', 'all')
+    if period not in dict(LeaderboardEntry.PERIOD_CHOICES):
+        period = 'all'
+
+    my_rank, my_entry = None, None
+    if request.user.is_authenticated:
+        my_rank, my_entry = leaderboard.rank_of(request.user, period)
+
+    context = {
+        'period': period,
+        'period_choices': LeaderboardEntry.PERIOD_CHOICES,
+        'bucket': leaderboard.current_bucket(period),
+        'entries': leaderboard.top_helpers(period),
+        'my_rank': my_rank,
+        'my_entry': my_entry,
+    }
+    return render(request, 'core/leaderboard.html', context)
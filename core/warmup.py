@@ -0,0 +1,86 @@
+# core/warmup.py
+
+"""
+WSGI/ASGI 워커 예열 (warm-up)
+
+config/wsgi.py, config/asgi.py 가 애플리케이션 객체를 만든 직후 호출합니다.
+첫 요청이 부담하던 비용을 워커 시작 시점으로 옮깁니다.
+
+1. core/templates, core/jinja2 아래 모든 템플릿 컴파일 (캐시 로더 / Jinja2 캐시에 적재)
+2. URL 리졸버 구성 및 모든 URL 이름 역참조
+
+DB 연결은 미리 열지 않습니다. CONN_MAX_AGE=0 이면 첫 요청이 끝날 때 닫히고,
+gunicorn --preload 처럼 마스터에서 앱을 불러온 뒤 fork 하면 연결 소켓이 워커들 사이에 공유되기 때문입니다.
+
+환경 변수 DJANGO_WARMUP=0 으로 끌 수 있습니다.
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+
+from django.template import TemplateDoesNotExist, TemplateSyntaxError
+from django.template.loader import get_template
+from django.urls import NoReverseMatch, get_resolver, reverse
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = Path(__file__).resolve().parent
+TEMPLATE_DIRS = (APP_DIR / 'templates', APP_DIR / 'jinja2')
+
+
+def warmup_enabled():
+    return os.environ.get('DJANGO_WARMUP', '1') != '0'
+
+
+def compile_templates(template_dirs=TEMPLATE_DIRS):
+    """ 템플릿 디렉터리의 모든 템플릿을 미리 컴파일하고, 컴파일한 개수를 반환합니다. """
+    names = {
+        path.relative_to(template_dir).as_posix()
+        for template_dir in template_dirs
+        for path in template_dir.rglob('*.html')
+    }
+    count = 0
+    for name in sorted(names):
+        try:
+            get_template(name)
+        except (TemplateDoesNotExist, TemplateSyntaxError):
+            logger.exception('템플릿 예열 실패: %s', name)
+            continue
+        count += 1
+    return count
+
+
+def resolve_url_names():
+    """ URL 리졸버를 구성하고 인자가 필요 없는 모든 URL 이름을 역참조합니다. """
+    resolver = get_resolver()
+    names = [name for name in resolver.reverse_dict if isinstance(name, str)]
+    for namespace, (_, sub_resolver) in resolver.namespace_dict.items():
+        names += [f'{namespace}:{name}' for name in sub_resolver.reverse_dict if isinstance(name, str)]
+
+    count = 0
+    for name in names:
+        try:
+            reverse(name)
+        except NoReverseMatch:
+            # 인자가 필요한 URL 은 리졸버 구성만으로 충분합니다.
+            continue
+        count += 1
+    return count
+
+
+def warm_up():
+    """ 예열 단계를 모두 실행하고 단계별 소요 시간(ms)을 반환합니다. """
+    timings = {}
+    for step in (compile_templates, resolve_url_names):
+        started = time.perf_counter()
+        try:
+            result = step()
+        except Exception:
+            # 예열 실패가 워커 시작을 막아서는 안 됩니다. (첫 요청에서 다시 시도됨)
+            logger.exception('워커 예열 단계 실패: %s', step.__name__)
+            result = None
+        timings[step.__name__] = {'result': result, 'ms': round((time.perf_counter() - started) * 1000, 2)}
+    logger.info('워커 예열 완료: %s', timings)
+    return timings